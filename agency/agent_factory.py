@@ -11,6 +11,13 @@ from .communication.mcp_integration import MCPServerManager
 
 logger = get_logger(__name__)
 
+# Agent fields that updates are not allowed to change
+_IMMUTABLE_AGENT_KEYS = frozenset(("id", "created_at"))
+
+class AgentCreationError(Exception):
+    """Raised when an agent cannot be created."""
+    pass
+
 class AgentFactory:
     """
     Factory for creating and managing AI agents.
@@ -52,7 +59,13 @@ class AgentFactory:
             
         Returns:
             Dict containing the new agent's information
+        
+        Raises:
+            AgentCreationError: If the agent information is invalid or can't be registered
         """
+        if not name:
+            raise AgentCreationError("Agent name is required")
+        
         # Generate a unique ID for the agent
         agent_id = str(uuid.uuid4())
         
@@ -90,8 +103,12 @@ class AgentFactory:
         if a2a_card_path:
             agent_info["a2a_card_path"] = str(a2a_card_path)
         
-        # Register the agent
-        self.registry.register_agent(agent_id, agent_info)
+        # Register the agent; the registry writes it to disk in the background,
+        # so only invalid agent information can fail here
+        try:
+            self.registry.register_agent(agent_id, agent_info)
+        except (TypeError, ValueError) as e:
+            raise AgentCreationError(f"Failed to register agent {name}: {e}") from e
         
         logger.info(f"Created agent: {name} ({agent_id})")
         
@@ -149,7 +166,7 @@ class AgentFactory:
         
         # Apply updates
         for key, value in updates.items():
-            if key not in ["id", "created_at"]:  # Prevent changing immutable fields
+            if key not in _IMMUTABLE_AGENT_KEYS:
                 agent[key] = value
         
         # Update the agent's A2A card if it exists
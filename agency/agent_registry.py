@@ -2,8 +2,9 @@ import json
 import time
 import threading
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Set, Tuple
 
 from .utils.logging import get_logger
 from .utils.persistence import PersistenceManager
@@ -25,13 +26,131 @@ class AgentRegistry:
         """
         self.registry_path = registry_path
         self.lock = threading.RLock()  # Use RLock for nested lock acquisition
+        # Writes are coalesced under the registry lock: a burst of changes is
+        # saved once now and once more after the flush interval (or at exit)
         self.persistence = PersistenceManager[Dict[str, Dict[str, Any]]](
             registry_path, 
             default_value={}, 
             auto_save=True, 
-            use_cache=True
+            use_cache=True,
+            lock=self.lock
         )
         self.agents = self.persistence.load()
+        
+        # Incremented on every change so callers can tell when cached views are stale
+        self._revision = 0
+        
+        # Inverted indexes from skill/category to agent IDs, kept in insertion
+        # order by using dicts as ordered sets
+        self._skill_index: Dict[str, Dict[str, None]] = {}
+        self._category_index: Dict[str, Dict[str, None]] = {}
+        # Keys each agent is currently indexed under; agent dicts can be
+        # modified in place before being re-registered, so they can't be trusted
+        self._indexed_keys: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        # Lowercased name, description and skills of each agent, joined for search
+        self._search_text: Dict[str, str] = {}
+        for agent_id, agent in self.agents.items():
+            self._reindex_agent(agent_id, agent)
+    
+    @staticmethod
+    def _index_keys(agent: Optional[Dict[str, Any]]) -> Tuple[Set[str], Set[str]]:
+        """
+        Get the skills and category an agent is indexed under.
+        
+        Args:
+            agent: Agent information, or None for no agent
+        
+        Returns:
+            Tuple of the set of skills and the set of categories
+        """
+        if not agent:
+            return set(), set()
+        
+        skills = set(agent.get("skills") or ())
+        category = agent.get("category")
+        return skills, ({category} if category is not None else set())
+    
+    @staticmethod
+    def _update_index(index: Dict[str, Dict[str, None]], agent_id: str, removed: Iterable[str], added: Iterable[str]) -> None:
+        """
+        Move an agent ID between index buckets.
+        
+        Args:
+            index: Index to update
+            agent_id: Unique identifier for the agent
+            removed: Keys the agent no longer has
+            added: Keys the agent now has
+        """
+        for key in removed:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(agent_id, None)
+                if not bucket:
+                    del index[key]
+        
+        for key in added:
+            index.setdefault(key, {})[agent_id] = None
+    
+    @staticmethod
+    def _build_search_text(agent: Dict[str, Any]) -> str:
+        """
+        Build the text searched by search_agents for an agent.
+        
+        Fields are joined with NUL characters so a query can't match across
+        two of them.
+        
+        Args:
+            agent: Agent information
+        
+        Returns:
+            Lowercased searchable text
+        """
+        fields = [agent.get("name") or "", agent.get("description") or ""]
+        fields.extend(agent.get("skills") or ())
+        return "\0".join(fields).lower()
+    
+    def _reindex_agent(self, agent_id: str, agent: Optional[Dict[str, Any]]) -> None:
+        """
+        Update the skill and category indexes for an agent.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+            agent: Agent information after the change, or None if removed
+        """
+        old_skills, old_categories = self._indexed_keys.pop(agent_id, (set(), set()))
+        new_skills, new_categories = self._index_keys(agent)
+        if agent is not None:
+            self._indexed_keys[agent_id] = (new_skills, new_categories)
+            self._search_text[agent_id] = self._build_search_text(agent)
+        else:
+            self._search_text.pop(agent_id, None)
+        
+        self._update_index(self._skill_index, agent_id, old_skills - new_skills, new_skills - old_skills)
+        self._update_index(self._category_index, agent_id, old_categories - new_categories, new_categories - old_categories)
+    
+    def _save(self) -> None:
+        """Mark the agents as changed, so the persistence manager writes them."""
+        agents = self.agents
+        self.persistence.update(lambda _: agents)
+    
+    def flush(self) -> bool:
+        """
+        Write any registry change that is still waiting to be saved.
+        
+        Returns:
+            True if nothing was pending or it was saved successfully, False otherwise
+        """
+        return self.persistence.flush()
+    
+    @property
+    def revision(self) -> int:
+        """
+        Get the number of changes made to the registry since it was loaded.
+        
+        Returns:
+            Revision counter of the registry
+        """
+        return self._revision
     
     def register_agent(self, agent_id: str, agent_info: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -55,8 +174,11 @@ class AgentRegistry:
                 agent_info["updated_at"] = agent_info["created_at"]
                 self.agents[agent_id] = agent_info
             
-            # Save to disk
-            self.persistence.save(self.agents)
+            self._reindex_agent(agent_id, self.agents[agent_id])
+            self._revision += 1
+            
+            # Save to disk, coalesced with any other changes in this burst
+            self._save()
             
         logger.info(f"Agent {agent_id} registered: {agent_info['name']}")
         return self.agents[agent_id]
@@ -74,7 +196,9 @@ class AgentRegistry:
         with self.lock:
             if agent_id in self.agents:
                 del self.agents[agent_id]
-                self.persistence.save(self.agents)
+                self._reindex_agent(agent_id, None)
+                self._revision += 1
+                self._save()
                 logger.info(f"Agent {agent_id} deregistered")
                 return True
             else:
@@ -94,20 +218,70 @@ class AgentRegistry:
         with self.lock:
             return self.agents.get(agent_id)
     
-    def list_agents(self, filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+    def get_agents(self, agent_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve information about several agents at once.
+        
+        Args:
+            agent_ids: Unique identifiers of the agents
+        
+        Returns:
+            Dictionary mapping each found agent ID to its information, in the
+            order the IDs were given; unknown IDs are left out
+        """
+        with self.lock:
+            agents = self.agents
+            return {
+                agent_id: agents[agent_id]
+                for agent_id in agent_ids
+                if agent_id in agents
+            }
+    
+    def list_agents(
+        self,
+        filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all registered agents, optionally filtered.
         
         Args:
             filter_func: Optional function to filter agents
+            limit: Optional maximum number of agents to return
         
         Returns:
             List of agent information dictionaries
         """
         with self.lock:
+            agents: Iterable[Dict[str, Any]] = self.agents.values()
             if filter_func:
-                return [agent for agent in self.agents.values() if filter_func(agent)]
-            return list(self.agents.values())
+                agents = (agent for agent in agents if filter_func(agent))
+            if limit is not None:
+                return list(islice(agents, limit))
+            return list(agents)
+    
+    def iter_agents(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a snapshot of all registered agents.
+        
+        The snapshot is taken under the lock, so the registry can change
+        while the caller is still iterating.
+        
+        Returns:
+            Iterator over agent information dictionaries
+        """
+        with self.lock:
+            return iter(tuple(self.agents.values()))
+    
+    def count_agents(self) -> int:
+        """
+        Count the registered agents.
+        
+        Returns:
+            Number of registered agents
+        """
+        with self.lock:
+            return len(self.agents)
     
     def update_agent_status(self, agent_id: str, status: str) -> bool:
         """
@@ -124,7 +298,8 @@ class AgentRegistry:
             if agent_id in self.agents:
                 self.agents[agent_id]["status"] = status
                 self.agents[agent_id]["updated_at"] = datetime.now().isoformat()
-                self.persistence.save(self.agents)
+                self._revision += 1
+                self._save()
                 logger.info(f"Agent {agent_id} status updated: {status}")
                 return True
             else:
@@ -142,10 +317,7 @@ class AgentRegistry:
             List of agent information dictionaries
         """
         with self.lock:
-            return [
-                agent for agent in self.agents.values()
-                if "skills" in agent and skill in agent["skills"]
-            ]
+            return [self.agents[agent_id] for agent_id in self._skill_index.get(skill, ())]
     
     def get_agents_by_status(self, status: str) -> List[Dict[str, Any]]:
         """
@@ -191,13 +363,14 @@ class AgentRegistry:
         """
         query = query.lower()
         with self.lock:
+            if "\0" in query:
+                # Can't match the joined text, nor any field
+                return []
+            
+            search_text = self._search_text
             return [
-                agent for agent in self.agents.values()
-                if (
-                    ("name" in agent and query in agent["name"].lower()) or
-                    ("description" in agent and query in agent["description"].lower()) or
-                    ("skills" in agent and any(query in skill.lower() for skill in agent["skills"]))
-                )
+                self.agents[agent_id] for agent_id in self.agents
+                if query in search_text[agent_id]
             ]
     
     def get_active_agents(self) -> List[Dict[str, Any]]:
@@ -220,9 +393,40 @@ class AgentRegistry:
             List of agent information dictionaries
         """
         with self.lock:
+            return [self.agents[agent_id] for agent_id in self._category_index.get(category, ())]
+    
+    def get_agents_by_skill_and_category(
+        self,
+        skill: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find agents matching a skill and/or a category by intersecting the
+        indexes before looking up any agent.
+        
+        Args:
+            skill: Skill to look for, or None to ignore skills
+            category: Category to look for, or None to ignore categories
+        
+        Returns:
+            List of agent information dictionaries
+        """
+        with self.lock:
+            buckets = []
+            if skill is not None:
+                buckets.append(self._skill_index.get(skill, {}))
+            if category is not None:
+                buckets.append(self._category_index.get(category, {}))
+            
+            if not buckets:
+                return list(self.agents.values())
+            
+            # Walk the smallest bucket and check membership in the others
+            buckets.sort(key=len)
+            smallest, others = buckets[0], buckets[1:]
             return [
-                agent for agent in self.agents.values()
-                if "category" in agent and agent["category"] == category
+                self.agents[agent_id] for agent_id in smallest
+                if all(agent_id in bucket for bucket in others)
             ]
     
     def get_agents_by_creation_date(self, date_from: str, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
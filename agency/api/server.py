@@ -42,6 +42,9 @@ class APIServer:
         self.mcp_manager = mcp_manager
         self.a2a_server = a2a_server
         
+        # uvicorn server while serve() is running
+        self._server: Optional[uvicorn.Server] = None
+        
         # Create the FastAPI app
         self.app = FastAPI(
             title="AI Agency API",
@@ -116,13 +119,18 @@ class APIServer:
                 }
             }
     
-    def run(self, host: Optional[str] = None, port: Optional[int] = None):
+    def _server_config(self, host: Optional[str] = None, port: Optional[int] = None) -> uvicorn.Config:
         """
-        Run the API server.
+        Build the uvicorn configuration for the API server.
+        
+        uvicorn picks uvloop and httptools on its own when they are installed.
         
         Args:
             host: Host to bind to (defaults to Config.SERVER_HOST)
             port: Port to listen on (defaults to Config.SERVER_PORT)
+        
+        Returns:
+            uvicorn configuration
         """
         if host is None:
             host = Config.SERVER_HOST
@@ -132,20 +140,52 @@ class APIServer:
         
         logger.info(f"Starting API server on {host}:{port}")
         
-        # Run the server
         if Config.ENABLE_SSL and Config.SSL_CERT_FILE and Config.SSL_KEY_FILE:
             # Run with SSL
-            uvicorn.run(
+            return uvicorn.Config(
                 self.app,
                 host=host,
                 port=port,
                 ssl_keyfile=Config.SSL_KEY_FILE,
                 ssl_certfile=Config.SSL_CERT_FILE
             )
-        else:
-            # Run without SSL
-            uvicorn.run(
-                self.app,
-                host=host,
-                port=port
-            )
+        
+        # Run without SSL
+        return uvicorn.Config(
+            self.app,
+            host=host,
+            port=port
+        )
+    
+    def run(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """
+        Run the API server, blocking until it stops.
+        
+        This starts its own event loop; from a coroutine, await serve() instead.
+        
+        Args:
+            host: Host to bind to (defaults to Config.SERVER_HOST)
+            port: Port to listen on (defaults to Config.SERVER_PORT)
+        """
+        uvicorn.Server(self._server_config(host, port)).run()
+    
+    async def serve(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """
+        Serve the API on the running event loop until the server stops.
+        
+        Args:
+            host: Host to bind to (defaults to Config.SERVER_HOST)
+            port: Port to listen on (defaults to Config.SERVER_PORT)
+        """
+        self._server = uvicorn.Server(self._server_config(host, port))
+        try:
+            await self._server.serve()
+        finally:
+            self._server = None
+    
+    def stop(self) -> None:
+        """
+        Ask a server started with serve() to shut down gracefully.
+        """
+        if self._server is not None:
+            self._server.should_exit = True
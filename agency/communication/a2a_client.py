@@ -1,32 +1,79 @@
 import json
 import asyncio
 import uuid
-from typing import Dict, List, Any, Optional, Callable, Union, AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional, Callable, Union, AsyncGenerator, AsyncIterator
 import httpx
 from httpx_sse import aconnect_sse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+def _decode_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON bytes or text
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    return json.loads(data)
+
 class A2AClient:
     """
     Client for communicating with agents using the A2A protocol.
     """
     
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the A2A client.
         
         Args:
             base_url: Base URL of the agent's A2A endpoint
             api_key: Optional API key for authentication
+            client: Optional shared HTTP client, so connections are pooled
+                across A2A clients; a short-lived client is used per request
+                otherwise
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.headers = {}
         if api_key:
             self.headers["x-api-key"] = api_key
+        self._client = client
+    
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get the HTTP client to use for a request.
+        
+        Yields:
+            The shared HTTP client, or a new one closed after the request
+        """
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
     
     async def get_agent_card(self) -> Dict[str, Any]:
         """
@@ -36,10 +83,11 @@ class A2AClient:
             Agent card dictionary
         """
         well_known_url = f"{self.base_url}/.well-known/agent.json"
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.get(well_known_url, headers=self.headers)
             response.raise_for_status()
-            return response.json()
+            result: Dict[str, Any] = _decode_json(response.content)
+            return result
     
     async def send_message(
         self,
@@ -104,10 +152,11 @@ class A2AClient:
         Returns:
             Agent response
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(self.base_url, json=payload, headers=headers)
             response.raise_for_status()
-            return response.json()
+            result: Dict[str, Any] = _decode_json(response.content)
+            return result
     
     async def _stream_response(
         self,
@@ -126,12 +175,12 @@ class A2AClient:
         Yields:
             Server-sent events
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with aconnect_sse(client, "POST", self.base_url, json=payload, headers=headers) as event_source:
                 async for event in event_source.aiter_sse():
                     if event.data:
                         try:
-                            data = json.loads(event.data)
+                            data = _decode_json(event.data)
                             if callback:
                                 callback(data)
                             yield data
@@ -15,6 +15,37 @@ from ..config import Config
 
 logger = get_logger(__name__)
 
+# Translation table for ASCII-only lowercasing of keyword probe buffers
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+def _keyword_probe(text: str) -> bytes:
+    """
+    Build an ASCII-lowercased buffer for keyword checks.
+    
+    Args:
+        text: Message text to probe
+    
+    Returns:
+        Lowercased ASCII bytes of the text (non-ASCII characters become "?")
+    """
+    return text.encode("ascii", "replace").translate(_ASCII_LOWER)
+
+# Keywords that drive intent selection for mock responses
+_INTENT_KEYWORDS = (b"create", b"agent", b"list", b"file", b"data")
+
+def _match_keywords(text: str) -> frozenset:
+    """
+    Find the intent keywords present in a message.
+    
+    Args:
+        text: Message text to scan
+    
+    Returns:
+        Set of matched keywords (as ASCII bytes)
+    """
+    probe = _keyword_probe(text)
+    return frozenset(keyword for keyword in _INTENT_KEYWORDS if keyword in probe)
+
 class A2AServer:
     """
     Server for exposing agents via the A2A protocol.
@@ -798,7 +829,7 @@ class A2AServer:
                 "agent_management",
                 "inter_agent_communication"
             ],
-            "agent_count": len(self.registry.list_agents()),
+            "agent_count": self.registry.count_agents(),
             "version": "1.0.0"
         }
         
@@ -822,26 +853,49 @@ class A2AServer:
             Generated response text
         """
         # In a real implementation, this would interact with the actual agent
-        agent_name = agent.get("name", "Agent")
-        agent_description = agent.get("description", "")
-        agent_skills = agent.get("skills", [])
+        matched = _match_keywords(message_text)
         
-        # Build a response based on the agent's info and message
-        if "create" in message_text.lower() and "agent" in message_text.lower():
-            return f"I'm {agent_name}. I'd be happy to help with creating a new agent. Please provide details like the name, description, and skills for the new agent."
-        
-        if "list" in message_text.lower() and "agent" in message_text.lower():
-            return f"I'm {agent_name}. I can list all available agents. Currently, there are {len(self.registry.list_agents())} agents registered in the system."
-        
-        if "file" in message_text.lower() and file_parts:
-            return f"I'm {agent_name}. I received your file{' ' + file_parts[0].get('file_name', '') if file_parts[0].get('file_name') else ''}. I'll process it according to my capabilities: {', '.join(agent_skills)}."
-        
-        if "data" in message_text.lower() and data_parts:
-            return f"I'm {agent_name}. I received your structured data. I'll analyze it based on my expertise in: {', '.join(agent_skills)}."
+        # Use the first intent whose keywords all appear in the message
+        for keywords, responder in self._AGENT_INTENTS:
+            if keywords <= matched:
+                response = responder(self, agent, file_parts, data_parts)
+                if response is not None:
+                    return response
         
         # Default response
+        agent_name = agent.get("name", "Agent")
+        agent_description = agent.get("description", "")
+        agent_skills = agent.get("skills", [])
         return f"I'm {agent_name}, specialized in {', '.join(agent_skills)}. {agent_description} How can I assist you today?"
     
+    def _agent_create_response(self, agent: Dict[str, Any], file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a request to create an agent."""
+        return f"I'm {agent.get('name', 'Agent')}. I'd be happy to help with creating a new agent. Please provide details like the name, description, and skills for the new agent."
+    
+    def _agent_list_response(self, agent: Dict[str, Any], file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a request to list agents."""
+        return f"I'm {agent.get('name', 'Agent')}. I can list all available agents. Currently, there are {self.registry.count_agents()} agents registered in the system."
+    
+    def _agent_file_response(self, agent: Dict[str, Any], file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a message with attached files."""
+        if not file_parts:
+            return None
+        return f"I'm {agent.get('name', 'Agent')}. I received your file{' ' + file_parts[0].get('file_name', '') if file_parts[0].get('file_name') else ''}. I'll process it according to my capabilities: {', '.join(agent.get('skills', []))}."
+    
+    def _agent_data_response(self, agent: Dict[str, Any], file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a message with attached structured data."""
+        if not data_parts:
+            return None
+        return f"I'm {agent.get('name', 'Agent')}. I received your structured data. I'll analyze it based on my expertise in: {', '.join(agent.get('skills', []))}."
+    
+    # Ordered (required keywords, responder) pairs for agent responses
+    _AGENT_INTENTS = (
+        (frozenset((b"create", b"agent")), _agent_create_response),
+        (frozenset((b"list", b"agent")), _agent_list_response),
+        (frozenset((b"file",)), _agent_file_response),
+        (frozenset((b"data",)), _agent_data_response),
+    )
+    
     def _generate_agency_response(self, message_text: str, file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> str:
         """
         Generate a mock response from the agency.
@@ -854,29 +908,14 @@ class A2AServer:
         Returns:
             Generated response text
         """
-        if "create" in message_text.lower() and "agent" in message_text.lower():
-            return (
-                "I am the AI Agency. I can help you create a new agent. "
-                "To create an agent, I need the following information:\n"
-                "- Name for the agent\n"
-                "- Description of its purpose\n"
-                "- List of skills it should have\n"
-                "- (Optional) Specific model to use"
-            )
-        
-        if "list" in message_text.lower() and "agent" in message_text.lower():
-            agents = self.registry.list_agents()
-            if agents:
-                agent_list = "\n".join([f"- {agent['name']}: {agent['description']}" for agent in agents[:5]])
-                return f"Here are the available agents:\n{agent_list}\n\nThere are {len(agents)} agents in total."
-            else:
-                return "There are no agents currently registered in the system."
+        matched = _match_keywords(message_text)
         
-        if "file" in message_text.lower() and file_parts:
-            return f"I received your file{' ' + file_parts[0].get('file_name', '') if file_parts[0].get('file_name') else ''}. How would you like me to process it? I can create specialized agents for handling this type of data."
-        
-        if "data" in message_text.lower() and data_parts:
-            return "I received your structured data. I can create specialized agents for analyzing this kind of information or forward it to an existing agent. What would you like to do?"
+        # Use the first intent whose keywords all appear in the message
+        for keywords, responder in self._AGENCY_INTENTS:
+            if keywords <= matched:
+                response = responder(self, file_parts, data_parts)
+                if response is not None:
+                    return response
         
         # Default response
         return (
@@ -888,6 +927,47 @@ class A2AServer:
             "How can I assist you today?"
         )
     
+    def _agency_create_response(self, file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a request to create an agent."""
+        return (
+            "I am the AI Agency. I can help you create a new agent. "
+            "To create an agent, I need the following information:\n"
+            "- Name for the agent\n"
+            "- Description of its purpose\n"
+            "- List of skills it should have\n"
+            "- (Optional) Specific model to use"
+        )
+    
+    def _agency_list_response(self, file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a request to list agents."""
+        total = self.registry.count_agents()
+        if total:
+            top = self.registry.list_agents(limit=5)
+            agent_list = "\n".join(f"- {agent['name']}: {agent['description']}" for agent in top)
+            return f"Here are the available agents:\n{agent_list}\n\nThere are {total} agents in total."
+        else:
+            return "There are no agents currently registered in the system."
+    
+    def _agency_file_response(self, file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a message with attached files."""
+        if not file_parts:
+            return None
+        return f"I received your file{' ' + file_parts[0].get('file_name', '') if file_parts[0].get('file_name') else ''}. How would you like me to process it? I can create specialized agents for handling this type of data."
+    
+    def _agency_data_response(self, file_parts: List[Dict[str, Any]], data_parts: List[Dict[str, Any]]) -> Optional[str]:
+        """Respond to a message with attached structured data."""
+        if not data_parts:
+            return None
+        return "I received your structured data. I can create specialized agents for analyzing this kind of information or forward it to an existing agent. What would you like to do?"
+    
+    # Ordered (required keywords, responder) pairs for agency responses
+    _AGENCY_INTENTS = (
+        (frozenset((b"create", b"agent")), _agency_create_response),
+        (frozenset((b"list", b"agent")), _agency_list_response),
+        (frozenset((b"file",)), _agency_file_response),
+        (frozenset((b"data",)), _agency_data_response),
+    )
+    
     def run(self, host: str, port: int):
         """
         Run the A2A server.
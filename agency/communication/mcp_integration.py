@@ -1,6 +1,7 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from google.adk.tools.mcp import MCPToolset
@@ -10,10 +11,45 @@ from ..config import Config
 
 logger = get_logger(__name__)
 
+# Maximum number of threads used when talking to MCP servers concurrently
+_MAX_WORKERS = 16
+
+# Configuration keys required for each supported MCP server type
+_REQUIRED_KEYS = {
+    "stdio": ("command",),
+    "sse": ("url",),
+    "websocket": ("url",),
+    "http": ("url",),
+}
+
+def _validate_server_config(server_config: Dict[str, Any]) -> Optional[str]:
+    """
+    Check that an MCP server configuration has the keys its type requires.
+    
+    Args:
+        server_config: Configuration for the server
+    
+    Returns:
+        Description of the problem, or None if the configuration is valid
+    """
+    server_type = server_config.get("type", "stdio")
+    required_keys = _REQUIRED_KEYS.get(server_type)
+    if required_keys is None:
+        return f"Unsupported MCP server type: {server_type}"
+    
+    missing = [key for key in required_keys if key not in server_config]
+    if missing:
+        return f"Missing required keys for {server_type} server: {', '.join(missing)}"
+    
+    return None
+
 def create_mcp_toolset(server_name: str, server_config: Dict[str, Any]) -> MCPToolset:
     """
     Create an MCP toolset for the specified server.
     
+    The (read-only) configuration values are copied into plain lists and
+    dicts before being handed to the toolset.
+    
     Args:
         server_name: Name of the MCP server
         server_config: Configuration for the server
@@ -32,9 +68,9 @@ def create_mcp_toolset(server_name: str, server_config: Dict[str, Any]) -> MCPTo
             parameters={
                 "server_type": "stdio",
                 "command": server_config.get("command"),
-                "args": server_config.get("args", []),
+                "args": list(server_config.get("args", [])),
                 "cwd": server_config.get("cwd"),
-                "env": server_config.get("env", {}),
+                "env": dict(server_config.get("env", {})),
                 "cache_tools_list": server_config.get("cache_tools_list", False)
             }
         )
@@ -44,7 +80,7 @@ def create_mcp_toolset(server_name: str, server_config: Dict[str, Any]) -> MCPTo
             parameters={
                 "server_type": "sse",
                 "url": server_config.get("url"),
-                "headers": server_config.get("headers", {}),
+                "headers": dict(server_config.get("headers", {})),
                 "cache_tools_list": server_config.get("cache_tools_list", False)
             }
         )
@@ -54,7 +90,7 @@ def create_mcp_toolset(server_name: str, server_config: Dict[str, Any]) -> MCPTo
             parameters={
                 "server_type": "websocket",
                 "url": server_config.get("url"),
-                "headers": server_config.get("headers", {}),
+                "headers": dict(server_config.get("headers", {})),
                 "cache_tools_list": server_config.get("cache_tools_list", False)
             }
         )
@@ -64,13 +100,43 @@ def create_mcp_toolset(server_name: str, server_config: Dict[str, Any]) -> MCPTo
             parameters={
                 "server_type": "http",
                 "url": server_config.get("url"),
-                "headers": server_config.get("headers", {}),
+                "headers": dict(server_config.get("headers", {})),
                 "cache_tools_list": server_config.get("cache_tools_list", False)
             }
         )
     else:
         raise ValueError(f"Unsupported MCP server type: {server_type}")
 
+def _instantiate_all_from_config(servers: Optional[Dict[str, Any]] = None) -> Dict[str, MCPToolset]:
+    """
+    Create toolsets for every server in an MCP configuration.
+    
+    Args:
+        servers: Server configurations by name (defaults to Config.MCP_SERVERS)
+    
+    Returns:
+        Dictionary mapping server names to MCPToolset instances
+    """
+    mcp_servers = {}
+    
+    if servers is None:
+        servers = Config.MCP_SERVERS
+    
+    for server_name, server_config in servers.items():
+        # Skip misconfigured servers without going through the exception path
+        problem = _validate_server_config(server_config)
+        if problem:
+            logger.error(f"Failed to load MCP server {server_name}: {problem}")
+            continue
+        
+        try:
+            mcp_servers[server_name] = create_mcp_toolset(server_name, server_config)
+            logger.info(f"Loaded MCP server: {server_name}")
+        except Exception as e:
+            logger.error(f"Failed to load MCP server {server_name}: {e}")
+    
+    return mcp_servers
+
 def load_mcp_servers(config_path: Optional[Path] = None) -> List[MCPToolset]:
     """
     Load all configured MCP servers.
@@ -85,76 +151,92 @@ def load_mcp_servers(config_path: Optional[Path] = None) -> List[MCPToolset]:
     if config_path:
         Config.load_mcp_config()
     
-    mcp_servers = []
-    
     # Skip if MCP is disabled
     if not Config.MCP_ENABLED:
         logger.info("MCP is disabled, skipping server loading")
-        return mcp_servers
+        return []
     
-    for server_name, server_config in Config.MCP_SERVERS.items():
-        try:
-            mcp_toolset = create_mcp_toolset(server_name, server_config)
-            mcp_servers.append(mcp_toolset)
-            logger.info(f"Loaded MCP server: {server_name}")
-        except Exception as e:
-            logger.error(f"Failed to load MCP server {server_name}: {e}")
+    return list(_instantiate_all_from_config().values())
+
+def _safe_close(server_name: str, toolset: MCPToolset) -> None:
+    """
+    Close an MCP toolset, logging rather than raising on failure.
     
-    return mcp_servers
+    Args:
+        server_name: Name of the MCP server
+        toolset: Toolset to close
+    """
+    try:
+        # Close the server if it has a close method
+        if hasattr(toolset, 'close'):
+            toolset.close()
+    except Exception as e:
+        logger.error(f"Failed to close MCP server {server_name}: {e}")
 
 class MCPServerManager:
     """
     Manager for MCP servers, providing methods for loading, reloading, and accessing MCP toolsets.
     """
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, config_dict: Optional[Dict[str, Any]] = None):
         """
         Initialize the MCP server manager.
         
         Args:
             config_path: Optional path to the MCP configuration file
+            config_dict: Optional already parsed server configurations; when
+                given, the configuration isn't loaded again until a reload
         """
         self.config_path = config_path or Config.MCP_CONFIG_PATH
+        self.config_dict = config_dict
         self.mcp_servers: Dict[str, MCPToolset] = {}
+        self._tools_snapshot: Optional[Tuple[Any, ...]] = None
         self.load_servers()
     
-    def load_servers(self):
-        """Load all configured MCP servers."""
+    def load_servers(self, skip_config_reload: bool = False) -> None:
+        """
+        Load all configured MCP servers.
+        
+        Args:
+            skip_config_reload: Whether to use the already loaded configuration
+                instead of loading it again
+        """
         # Skip if MCP is disabled
         if not Config.MCP_ENABLED:
             logger.info("MCP is disabled, skipping server loading")
             return
         
         # Make sure the configuration is loaded
-        Config.load_mcp_config()
+        if not skip_config_reload and self.config_dict is None:
+            Config.load_mcp_config()
         
-        for server_name, server_config in Config.MCP_SERVERS.items():
-            try:
-                mcp_toolset = create_mcp_toolset(server_name, server_config)
-                self.mcp_servers[server_name] = mcp_toolset
-                logger.info(f"Loaded MCP server: {server_name}")
-            except Exception as e:
-                logger.error(f"Failed to load MCP server {server_name}: {e}")
+        self.mcp_servers.update(_instantiate_all_from_config(self._server_configs()))
+        self._tools_snapshot = None
     
     def reload_servers(self):
         """Reload all MCP servers."""
         # Close any open servers
-        for server_name, toolset in self.mcp_servers.items():
-            try:
-                # Close the server if it has a close method
-                if hasattr(toolset, 'close'):
-                    toolset.close()
-            except Exception as e:
-                logger.error(f"Failed to close MCP server {server_name}: {e}")
-        
-        # Clear the servers
-        self.mcp_servers.clear()
+        self._close_all()
         
-        # Reload the configuration
+        # Reload the configuration from the file, bypassing the cache
+        self.config_dict = None
+        Config.clear_mcp_config_cache()
         Config.load_mcp_config()
         
-        # Load the servers again
-        self.load_servers()
+        # Load the servers again from the freshly loaded configuration
+        self.load_servers(skip_config_reload=True)
+    
+    def _server_configs(self) -> Dict[str, Any]:
+        """
+        Get the server configurations this manager works from.
+        
+        Returns:
+            Server configurations by name
+        """
+        if self.config_dict is not None:
+            return self.config_dict
+        
+        return Config.MCP_SERVERS
     
     def get_server(self, server_name: str) -> Optional[MCPToolset]:
         """
@@ -189,21 +271,23 @@ class MCPServerManager:
         """
         return [
             toolset for server_name, toolset in self.mcp_servers.items()
-            if Config.MCP_SERVERS.get(server_name, {}).get("type") == server_type
+            if self._server_configs().get(server_name, {}).get("type") == server_type
         ]
     
     def close(self):
         """Close all MCP servers."""
-        for server_name, toolset in self.mcp_servers.items():
-            try:
-                # Close the server if it has a close method
-                if hasattr(toolset, 'close'):
-                    toolset.close()
-            except Exception as e:
-                logger.error(f"Failed to close MCP server {server_name}: {e}")
+        self._close_all()
+    
+    def _close_all(self) -> None:
+        """Close all MCP servers concurrently and clear them."""
+        if self.mcp_servers:
+            # Close in parallel so teardown takes as long as the slowest server
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(self.mcp_servers))) as executor:
+                list(executor.map(_safe_close, self.mcp_servers.keys(), self.mcp_servers.values()))
         
         # Clear the servers
         self.mcp_servers.clear()
+        self._tools_snapshot = None
     
     def get_tools_for_server(self, server_name: str) -> List[Dict[str, Any]]:
         """
@@ -236,15 +320,40 @@ class MCPServerManager:
         Returns:
             Dictionary mapping server names to lists of tool information dictionaries
         """
-        tools = {}
+        tools: Dict[str, List[Dict[str, Any]]] = {}
+        server_names = list(self.mcp_servers)
+        if not server_names:
+            return tools
         
-        for server_name in self.mcp_servers:
-            server_tools = self.get_tools_for_server(server_name)
-            if server_tools:
-                tools[server_name] = server_tools
+        # Query all servers concurrently so latency is bounded by the slowest one
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(server_names))) as executor:
+            results = executor.map(self.get_tools_for_server, server_names)
+            
+            for server_name, server_tools in zip(server_names, results):
+                if server_tools:
+                    tools[server_name] = server_tools
         
         return tools
     
+    @property
+    def tools_snapshot(self) -> Tuple[Any, ...]:
+        """
+        Get the tools of all MCP servers as one flat, cached sequence.
+        
+        The snapshot is rebuilt after servers are loaded, reloaded or closed.
+        
+        Returns:
+            Tuple of tools in server order
+        """
+        if self._tools_snapshot is None:
+            self._tools_snapshot = tuple(
+                tool
+                for server_tools in self.get_all_available_tools().values()
+                for tool in server_tools
+            )
+        
+        return self._tools_snapshot
+    
     def execute_tool(self, server_name: str, tool_name: str, params: Dict[str, Any]) -> Any:
         """
         Execute a tool on a specific MCP server.
@@ -1,5 +1,7 @@
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
 import yaml
 from dotenv import load_dotenv
 import logging
@@ -7,6 +9,22 @@ import logging
 # Load environment variables from .env file
 load_dotenv()
 
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert a parsed configuration into read-only structures.
+    
+    Args:
+        obj: Parsed configuration value
+    
+    Returns:
+        The value with dicts wrapped in MappingProxyType and lists converted to tuples
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
 class Config:
     """Configuration for the AI Agency System."""
     
@@ -32,6 +50,7 @@ class Config:
     DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemini-2.0-pro")
     MODEL_API_KEY = os.getenv("MODEL_API_KEY", "")
     USE_VERTEX_AI = os.getenv("USE_VERTEX_AI", "FALSE").upper() == "TRUE"
+    LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))  # Concurrent calls per model provider
     
     # Google Cloud configuration
     GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "")
@@ -61,24 +80,51 @@ class Config:
     # A2A configuration
     A2A_ENABLED = True  # A2A is always enabled
     A2A_ENDPOINT = f"http://{SERVER_HOST}:{SERVER_PORT}/a2a"
+    A2A_CLIENT_CACHE_SIZE = int(os.getenv("A2A_CLIENT_CACHE_SIZE", "256"))
     
-    # MCP servers
+    # MCP servers (read-only once loaded; callers must not mutate it)
     MCP_SERVERS = {}
     
+    # Parsed MCP configuration, cached as (path, mtime_ns, servers)
+    _mcp_config_cache: Optional[Tuple[Path, int, MappingProxyType]] = None
+    
     @classmethod
     def load_mcp_config(cls):
-        """Load MCP server configurations from YAML file."""
+        """
+        Load MCP server configurations from YAML file.
+        
+        The parsed configuration is cached by path and modification time, so
+        repeated calls are cheap while the file is unchanged.
+        """
         if cls.MCP_CONFIG_PATH.exists():
             try:
+                # Reuse the cached configuration if the file hasn't changed
+                mtime = cls.MCP_CONFIG_PATH.stat().st_mtime_ns
+                cache = cls._mcp_config_cache
+                if cache and cache[0] == cls.MCP_CONFIG_PATH and cache[1] == mtime:
+                    cls.MCP_SERVERS = cache[2]
+                    return
+                
                 with open(cls.MCP_CONFIG_PATH, 'r') as f:
                     cls.MCP_SERVERS = yaml.safe_load(f)
                     
                 # Replace environment variables in the configuration
                 cls._replace_env_vars_in_config()
+                
+                # Freeze the final configuration against accidental mutation
+                cls.MCP_SERVERS = _freeze(cls.MCP_SERVERS)
+                
+                # Cache the parsed configuration
+                cls._mcp_config_cache = (cls.MCP_CONFIG_PATH, mtime, cls.MCP_SERVERS)
             except Exception as e:
                 print(f"Error loading MCP config: {e}")
                 cls.MCP_SERVERS = {}
     
+    @classmethod
+    def clear_mcp_config_cache(cls) -> None:
+        """Clear the cached MCP configuration so the next load re-reads the file."""
+        cls._mcp_config_cache = None
+    
     @classmethod
     def _replace_env_vars_in_config(cls):
         """Replace environment variables in the MCP configuration."""
@@ -115,18 +115,45 @@ class GeminiModelFactory(ModelFactory):
         return model_id.lower().startswith("gemini")
 
 
+# Shared implementation for models served through LiteLLM
+class _LiteLlmProviderFactory(ModelFactory):
+    """
+    Base factory for models accessed through LiteLLM.
+    
+    Subclasses set ``provider_prefix`` and implement ``list_models`` and ``can_handle``.
+    """
+    
+    provider_prefix = ""
+    
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key
+    
+    def model_string(self, model_id: str) -> str:
+        """Get the LiteLLM model string, keeping IDs that already name a provider."""
+        if "/" in model_id:
+            return model_id
+        
+        return f"{self.provider_prefix}/{model_id}"
+    
+    def create_model(self, model_id: str, **kwargs) -> Any:
+        """Create a LiteLLM model instance for the provider."""
+        from google.adk.models.lite_llm import LiteLlm
+        
+        return LiteLlm(model=self.model_string(model_id), api_key=self.api_key, **kwargs)
+
+
 # Implementation for Claude models
-class ClaudeModelFactory(ModelFactory):
+class ClaudeModelFactory(_LiteLlmProviderFactory):
     """Factory for creating Claude model instances."""
     
+    provider_prefix = "anthropic"
+    
     def __init__(self, api_key: Optional[str] = None, use_vertex_ai: bool = False):
-        self.api_key = api_key
+        super().__init__(api_key)
         self.use_vertex_ai = use_vertex_ai
     
     def create_model(self, model_id: str, **kwargs) -> Any:
         """Create a Claude model instance."""
-        from google.adk.models.lite_llm import LiteLlm
-        
         # Configure the model string based on deployment
         if self.use_vertex_ai:
             from google.adk.models.anthropic_llm import Claude
@@ -137,11 +164,9 @@ class ClaudeModelFactory(ModelFactory):
             
             # Return the model ID directly for Vertex AI
             return model_id
-        else:
-            # Use LiteLLM for direct API access
-            model_string = f"anthropic/{model_id}"
-            
-            return LiteLlm(model=model_string, api_key=self.api_key, **kwargs)
+        
+        # Use LiteLLM for direct API access
+        return super().create_model(model_id, **kwargs)
     
     def list_models(self) -> List[Dict[str, Any]]:
         """List all Claude models."""
@@ -194,23 +219,10 @@ class ClaudeModelFactory(ModelFactory):
 
 
 # Implementation for GPT models (OpenAI)
-class GPTModelFactory(ModelFactory):
+class GPTModelFactory(_LiteLlmProviderFactory):
     """Factory for creating GPT model instances."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
-    
-    def create_model(self, model_id: str, **kwargs) -> Any:
-        """Create a GPT model instance."""
-        from google.adk.models.lite_llm import LiteLlm
-        
-        # Configure the model string
-        if "/" not in model_id:
-            model_string = f"openai/{model_id}"
-        else:
-            model_string = model_id
-        
-        return LiteLlm(model=model_string, api_key=self.api_key, **kwargs)
+    provider_prefix = "openai"
     
     def list_models(self) -> List[Dict[str, Any]]:
         """List all GPT models."""
@@ -255,23 +267,10 @@ class GPTModelFactory(ModelFactory):
 
 
 # Implementation for Mistral models
-class MistralModelFactory(ModelFactory):
+class MistralModelFactory(_LiteLlmProviderFactory):
     """Factory for creating Mistral model instances."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
-    
-    def create_model(self, model_id: str, **kwargs) -> Any:
-        """Create a Mistral model instance."""
-        from google.adk.models.lite_llm import LiteLlm
-        
-        # Configure the model string
-        if "/" not in model_id:
-            model_string = f"mistral/{model_id}"
-        else:
-            model_string = model_id
-        
-        return LiteLlm(model=model_string, api_key=self.api_key, **kwargs)
+    provider_prefix = "mistral"
     
     def list_models(self) -> List[Dict[str, Any]]:
         """List all Mistral models."""
@@ -316,23 +315,10 @@ class MistralModelFactory(ModelFactory):
 
 
 # Implementation for Llama models (Meta)
-class LlamaModelFactory(ModelFactory):
+class LlamaModelFactory(_LiteLlmProviderFactory):
     """Factory for creating Llama model instances."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
-    
-    def create_model(self, model_id: str, **kwargs) -> Any:
-        """Create a Llama model instance."""
-        from google.adk.models.lite_llm import LiteLlm
-        
-        # Configure the model string
-        if "/" not in model_id:
-            model_string = f"meta/{model_id}"
-        else:
-            model_string = model_id
-        
-        return LiteLlm(model=model_string, api_key=self.api_key, **kwargs)
+    provider_prefix = "meta"
     
     def list_models(self) -> List[Dict[str, Any]]:
         """List all Llama models."""
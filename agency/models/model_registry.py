@@ -1,21 +1,115 @@
-from typing import Dict, Any, Optional, Type, List
+from typing import Dict, Any, Callable, ClassVar, Optional, Tuple, Type, List
+import asyncio
 import importlib
-from pathlib import Path
+import os
+import re
+import sys
+import threading
+import time
+from functools import lru_cache, partial
 
 from .model_factory import ModelFactory
+from ..config import Config
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prefixes that settle the model type outright, keyed by their first character.
+# gemini/claude are checked before any marker, and the gpt markers outrank all
+# others, so an ID starting with one of these needs no further scanning.
+_FIRST_CHAR_PREFIXES = {
+    "g": (("gemini", "gemini"), ("gpt", "gpt")),
+    "c": (("claude", "claude"),),
+    "t": (("text-davinci", "gpt"),),
+    "o": (("openai", "gpt"),),
+}
+
+# Substring markers in priority order, with the model type each implies
+_MARKER_TYPES = (
+    ("gpt", "gpt"),
+    ("text-davinci", "gpt"),
+    ("openai", "gpt"),
+    ("mistral", "mistral"),
+    ("llama", "llama"),
+    ("vertex", "vertex"),
+    ("palm", "palm"),
+    ("bard", "bard"),
+)
+# Zero-width lookahead, so overlapping markers (e.g. "palm" in "palmistral") are all found
+_MARKER_RE = re.compile("(?=(" + "|".join(re.escape(marker) for marker, _ in _MARKER_TYPES) + "))")
+_MARKER_RANK = {marker: (rank, model_type) for rank, (marker, model_type) in enumerate(_MARKER_TYPES)}
+
+# Factories registered on first use, as "module:class" within this package,
+# with the configured constructor arguments each one accepts
+_PROVIDERS = {
+    "gemini": ("model_factory:GeminiModelFactory", ("api_key", "use_vertex_ai")),
+    "claude": ("model_factory:ClaudeModelFactory", ("api_key", "use_vertex_ai")),
+    "gpt": ("model_factory:GPTModelFactory", ("api_key",)),
+    "mistral": ("model_factory:MistralModelFactory", ("api_key",)),
+    "llama": ("model_factory:LlamaModelFactory", ("api_key",)),
+}
+
+def _provider_kwargs(arg_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Get the configured constructor arguments for a lazily loaded factory.
+    
+    Args:
+        arg_names: Names of the arguments the factory accepts
+    
+    Returns:
+        Keyword arguments for the factory constructor
+    """
+    values = {
+        "api_key": Config.MODEL_API_KEY or None,
+        "use_vertex_ai": Config.USE_VERTEX_AI,
+    }
+    return {name: values[name] for name in arg_names}
+
+# Seconds a model listing stays valid before factories are queried again
+_MODELS_CACHE_TTL = 60.0
+
+def _copy_models(models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy cached model dictionaries, including their list values, for a caller.
+    
+    Args:
+        models: Cached model information dictionaries
+    
+    Returns:
+        Copies the caller may modify without touching the cache
+    """
+    return [
+        {key: list(value) if isinstance(value, list) else value for key, value in model.items()}
+        for model in models
+    ]
+
 class ModelRegistry:
     """
     Registry for LLM models that can be used in the agency.
     """
     
+    # Recommended model ID for each task type
+    _TASK_MODELS: ClassVar[Dict[str, str]] = {
+        "chat": "gemini-2.0-pro",
+        "text-generation": "claude-3-opus-20240229",
+        "coding": "claude-3-opus-20240229",
+        "summarization": "claude-3-sonnet-20240229",
+        "reasoning": "claude-3-opus-20240229",
+        "translation": "gemini-2.0-pro",
+        "qa": "claude-3-sonnet-20240229",
+        "vision": "gemini-2.0-vision",
+        "fast-response": "claude-3-haiku-20240307",
+    }
+    
     def __init__(self):
         self._factories: Dict[str, ModelFactory] = {}
         self._model_classes: Dict[str, Type] = {}
         self._default_factory = None
+        self._models_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._categories_cache: Optional[Tuple[float, Dict[str, List[Dict[str, Any]]]]] = None
+        self._fast_paths: Dict[str, Callable[..., Any]] = {}
+        self._provider_lock = threading.Lock()
+        self._imported_modules = set()
     
     def register_factory(self, model_type: str, factory: ModelFactory, is_default: bool = False):
         """
@@ -26,10 +120,23 @@ class ModelRegistry:
             factory: Model factory instance
             is_default: Whether this factory should be the default
         """
-        self._factories[model_type.lower()] = factory
+        self._factories[sys.intern(model_type.lower())] = factory
         
         if is_default or self._default_factory is None:
             self._default_factory = factory
+        
+        self.clear_models_cache()
+    
+    def clear_models_cache(self) -> None:
+        """
+        Drop cached model listings so the next call queries the factories again.
+        
+        Specialized create paths are dropped too, since model IDs may now
+        resolve to a different factory.
+        """
+        self._models_cache = None
+        self._categories_cache = None
+        self._fast_paths = {}
     
     def register_model_class(self, model_type: str, model_class: Type):
         """
@@ -39,7 +146,7 @@ class ModelRegistry:
             model_type: Type of model (e.g., 'gemini', 'claude', 'gpt')
             model_class: Model class
         """
-        self._model_classes[model_type.lower()] = model_class
+        self._model_classes[sys.intern(model_type.lower())] = model_class
     
     def get_factory(self, model_type: Optional[str] = None) -> Optional[ModelFactory]:
         """
@@ -54,7 +161,51 @@ class ModelRegistry:
         if model_type is None:
             return self._default_factory
         
-        return self._factories.get(model_type.lower())
+        # Keys are stored lowercased, so try the argument as given first
+        factory = self._factories.get(model_type)
+        if factory is not None:
+            return factory
+        
+        return self._load_factory(model_type.lower())
+    
+    def _load_factory(self, model_type: str) -> Optional[ModelFactory]:
+        """
+        Get the factory for a lowercased model type, importing it on first use.
+        
+        Provider modules listed in the manifest are only imported when a model
+        of that type is first requested, so unused SDKs never load.
+        
+        Args:
+            model_type: Lowercased type of model
+        
+        Returns:
+            Model factory instance or None if none is registered or available
+        """
+        factory = self._factories.get(model_type)
+        if factory is not None or model_type not in _PROVIDERS:
+            return factory
+        
+        with self._provider_lock:
+            # Another thread may have loaded it while we waited
+            factory = self._factories.get(model_type)
+            if factory is not None:
+                return factory
+            
+            target, arg_names = _PROVIDERS[model_type]
+            module_name, class_name = target.split(":")
+            try:
+                module = importlib.import_module(f".{module_name}", __package__)
+                factory_class: Type[ModelFactory] = getattr(module, class_name)
+                factory = factory_class(**_provider_kwargs(arg_names))
+            except Exception as e:
+                logger.error(f"Failed to load factory for {model_type}: {e}")
+                return None
+            
+            self._factories[sys.intern(model_type)] = factory
+            self.clear_models_cache()
+            logger.info(f"Loaded model factory for {model_type}")
+            
+            return factory
     
     def get_model_class(self, model_type: str) -> Optional[Type]:
         """
@@ -66,6 +217,10 @@ class ModelRegistry:
         Returns:
             Model class
         """
+        model_class = self._model_classes.get(model_type)
+        if model_class is not None:
+            return model_class
+        
         return self._model_classes.get(model_type.lower())
     
     def create_model(self, model_id: str, **kwargs) -> Any:
@@ -82,50 +237,54 @@ class ModelRegistry:
         Raises:
             ValueError: If no factory can handle the model ID
         """
+        # Known model IDs skip type detection and factory dispatch
+        fast_path = self._fast_paths.get(model_id)
+        if fast_path is not None:
+            return fast_path(**kwargs)
+        
         # Try to determine the model type from the ID
         model_type = self._determine_model_type(model_id)
         
-        if model_type and model_type.lower() in self._factories:
-            # Use the determined factory
-            factory = self._factories[model_type.lower()]
-        elif self._default_factory:
-            # Use the default factory
-            factory = self._default_factory
-        else:
+        # Use the determined factory with a single lookup, loading it on first use
+        factory = self._factories.get(model_type) if model_type else None
+        if factory is None and model_type:
+            factory = self._load_factory(model_type)
+        
+        # Fall back to the default factory
+        factory = factory or self._default_factory
+        
+        if factory is None:
             # No factory available
             raise ValueError(f"No factory available for model ID: {model_id}")
         
         # Create the model
         return factory.create_model(model_id, **kwargs)
     
-    def _determine_model_type(self, model_id: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _determine_model_type(model_id: str) -> Optional[str]:
         """
         Determine the model type from the model ID.
         
+        Results are memoized since the set of model IDs seen is small.
+        
         Args:
             model_id: ID of the model (e.g., 'gemini-2.0-pro', 'claude-3-opus')
         
         Returns:
             Model type or None if unknown
         """
+        # Fast path: dispatch on the first character and compare a short prefix
+        for prefix, model_type in _FIRST_CHAR_PREFIXES.get(model_id[:1].lower(), ()):
+            if model_id[:len(prefix)].lower() == prefix:
+                return model_type
+        
         model_id = model_id.lower()
         
-        if model_id.startswith("gemini"):
-            return "gemini"
-        elif model_id.startswith("claude"):
-            return "claude"
-        elif any(name in model_id for name in ["gpt", "text-davinci", "openai"]):
-            return "gpt"
-        elif "mistral" in model_id:
-            return "mistral"
-        elif "llama" in model_id:
-            return "llama"
-        elif "vertex" in model_id:
-            return "vertex"
-        elif "palm" in model_id:
-            return "palm"
-        elif "bard" in model_id:
-            return "bard"
+        # Otherwise use the highest-priority marker found anywhere in the ID
+        markers = _MARKER_RE.findall(model_id)
+        if markers:
+            return min(_MARKER_RANK[marker] for marker in markers)[1]
         
         return None
     
@@ -133,42 +292,136 @@ class ModelRegistry:
         """
         List all available models that can be used.
         
+        Results are cached for a short time since factories may query remote APIs.
+        
         Returns:
             List of model information dictionaries
         """
-        all_models = []
+        cached = self._models_cache
+        if cached and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            return _copy_models(cached[1])
+        
+        results: List[Any] = []
         
         for model_type, factory in self._factories.items():
             try:
-                models = factory.list_models()
-                for model in models:
-                    model["type"] = model_type
-                all_models.extend(models)
+                results.append(factory.list_models())
             except Exception as e:
-                logger.error(f"Failed to list models for {model_type}: {e}")
+                results.append(e)
+        
+        return self._merge_model_lists(list(self._factories), results)
+    
+    async def list_available_models_async(self) -> List[Dict[str, Any]]:
+        """
+        List all available models, querying the factories concurrently.
+        
+        Each factory's list_models runs in a worker thread, so the total wait
+        is that of the slowest factory rather than the sum of all of them.
+        
+        Returns:
+            List of model information dictionaries
+        """
+        cached = self._models_cache
+        if cached and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            return _copy_models(cached[1])
+        
+        factories = dict(self._factories)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(factory.list_models) for factory in factories.values()),
+            return_exceptions=True
+        )
+        
+        return self._merge_model_lists(list(factories), results)
+    
+    def _merge_model_lists(self, model_types: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Tag and merge per-factory model lists, then refresh the listing cache.
+        
+        Args:
+            model_types: Model types in the same order as results
+            results: Model lists, or the exception raised while listing them
+        
+        Returns:
+            List of model information dictionaries
+        """
+        all_models = []
         
-        return all_models
+        for model_type, models in zip(model_types, results):
+            if isinstance(models, BaseException):
+                logger.error(f"Failed to list models for {model_type}: {models}")
+                continue
+            
+            for model in models:
+                model["type"] = model_type
+            all_models.extend(models)
+        
+        self._models_cache = (time.monotonic(), all_models)
+        self._fast_paths = self._build_fast_paths(all_models)
+        return _copy_models(all_models)
+    
+    def _build_fast_paths(self, models: List[Dict[str, Any]]) -> Dict[str, Callable[..., Any]]:
+        """
+        Bind each listed model ID to the create_model of the factory it resolves to.
+        
+        IDs whose provider factory has not been loaded yet are left to the
+        generic path, so building the table never imports a provider.
+        
+        Args:
+            models: Model information dictionaries
+        
+        Returns:
+            Dictionary mapping model IDs to ready-to-call create functions
+        """
+        fast_paths: Dict[str, Callable[..., Any]] = {}
+        
+        for model in models:
+            model_id = model.get("id")
+            if not model_id:
+                continue
+            
+            model_type = self._determine_model_type(model_id)
+            factory = self._factories.get(model_type) if model_type else None
+            if factory is None:
+                if model_type in _PROVIDERS:
+                    continue
+                factory = self._default_factory
+            
+            if factory is not None:
+                fast_paths[model_id] = partial(factory.create_model, model_id)
+        
+        return fast_paths
     
     def import_model_modules(self, base_module: str = "ai_agency.models"):
         """
         Import all model modules to register model factories and classes.
         
+        Repeated calls for the same base module are no-ops.
+        
         Args:
             base_module: Base module path
         """
+        if base_module in self._imported_modules:
+            return
+        
         try:
             module = importlib.import_module(base_module)
-            module_path = Path(module.__file__).parent
+            if module.__file__ is None:
+                raise ImportError(f"{base_module} is not a regular package")
+            module_path = os.path.dirname(module.__file__)
             
-            for file_path in module_path.glob("*.py"):
-                if file_path.name.startswith("_"):
-                    continue
-                
-                module_name = file_path.stem
+            with os.scandir(module_path) as entries:
+                module_names = [
+                    entry.name[:-3] for entry in entries
+                    if entry.name.endswith(".py") and not entry.name.startswith("_")
+                ]
+            
+            for module_name in module_names:
                 try:
                     importlib.import_module(f"{base_module}.{module_name}")
                 except Exception as e:
                     logger.error(f"Failed to import module {module_name}: {e}")
+            
+            self._imported_modules.add(base_module)
         except Exception as e:
             logger.error(f"Failed to import model modules: {e}")
     
@@ -179,6 +432,10 @@ class ModelRegistry:
         Returns:
             Dictionary of model categories with lists of models
         """
+        cached = self._categories_cache
+        if cached and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            return {category: _copy_models(models) for category, models in cached[1].items()}
+        
         categories = {}
         
         for model in self.list_available_models():
@@ -187,9 +444,12 @@ class ModelRegistry:
                 categories[category] = []
             categories[category].append(model)
         
-        return categories
+        self._categories_cache = (time.monotonic(), categories)
+        return {category: _copy_models(models) for category, models in categories.items()}
     
-    def get_recommended_model(self, task_type: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_recommended_model(task_type: str) -> Optional[str]:
         """
         Get a recommended model for a specific task type.
         
@@ -199,20 +459,7 @@ class ModelRegistry:
         Returns:
             Model ID or None if no recommendation available
         """
-        # Define task-model mapping
-        task_models = {
-            "chat": "gemini-2.0-pro",
-            "text-generation": "claude-3-opus-20240229",
-            "coding": "claude-3-opus-20240229",
-            "summarization": "claude-3-sonnet-20240229",
-            "reasoning": "claude-3-opus-20240229",
-            "translation": "gemini-2.0-pro",
-            "qa": "claude-3-sonnet-20240229",
-            "vision": "gemini-2.0-vision",
-            "fast-response": "claude-3-haiku-20240307",
-        }
-        
-        return task_models.get(task_type)
+        return ModelRegistry._TASK_MODELS.get(task_type)
 
 
 # Singleton instance
@@ -1,6 +1,9 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncGenerator, ClassVar, Optional, cast
 import asyncio
+import threading
+from collections import OrderedDict
 
+import httpx
 from google.adk.agent import BaseAgent, Message
 from google.adk.toolbox import ToolCall, Tool
 
@@ -16,17 +19,45 @@ from .tools.communication import CommunicationTool
 
 logger = get_logger(__name__)
 
+def _extract_text(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the first text part of the last message in an A2A response.
+    
+    Args:
+        response: Response from an A2A client
+    
+    Returns:
+        Text of the response, or None if it has no text part
+    """
+    result = response.get("result")
+    if not result:
+        return None
+    
+    messages = result.get("messages")
+    if not messages or len(messages) < 2:
+        return None
+    
+    for part in messages[-1].get("parts") or ():
+        if part.get("type") == "text":
+            return part.get("text", "")
+    
+    return None
+
 class ParentAgent(BaseAgent):
     """
     Parent agent that can create and manage other agents.
     """
     
+    # Base URL for agent A2A endpoints, resolved from the config on first use
+    _AGENT_URL_PREFIX: ClassVar[Optional[str]] = None
+    
     def __init__(
         self, 
         registry: AgentRegistry, 
         factory: AgentFactory, 
         mcp_manager: MCPServerManager,
-        model_id: Optional[str] = None
+        model_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize the parent agent.
@@ -36,6 +67,8 @@ class ParentAgent(BaseAgent):
             factory: Factory for creating agents
             mcp_manager: Manager for MCP servers
             model_id: ID of the model to use
+            http_client: Optional HTTP client to share with the caller; its
+                owner closes it, aclose() leaves it open
         """
         # Set up components
         self.registry = registry
@@ -57,7 +90,13 @@ class ParentAgent(BaseAgent):
         
         # Set additional attributes
         self.agent_instances = {}  # Store active agent instances
-        self.clients = {}  # Store A2A clients
+        self.clients: "OrderedDict[str, A2AClient]" = OrderedDict()  # LRU of A2A clients
+        self._clients_lock = threading.Lock()
+        
+        # Shared HTTP connection pool for all A2A clients, created on first use
+        # unless the caller passes one in
+        self._owns_http = http_client is None
+        self._http: Optional[httpx.AsyncClient] = http_client
     
     def _create_tools(self) -> List[Tool]:
         """
@@ -73,11 +112,7 @@ class ParentAgent(BaseAgent):
         ]
         
         # Add MCP tools if available
-        for server_name, server in self.mcp_manager.mcp_servers.items():
-            # Add server-specific tools
-            server_tools = server.list_tools()
-            for tool in server_tools:
-                tools.append(tool)
+        tools.extend(self.mcp_manager.tools_snapshot)
         
         return tools
     
@@ -92,13 +127,13 @@ class ParentAgent(BaseAgent):
             Response message
         """
         # Log the incoming message
-        logger.info(f"Received message: {message.text[:100]}...")
+        logger.info("Received message: %.100s...", message.text)
         
         # Process the message using the base agent
         response = await super().process(message)
         
         # Log the response
-        logger.info(f"Sending response: {response.text[:100]}...")
+        logger.info("Sending response: %.100s...", response.text)
         
         return response
     
@@ -129,29 +164,32 @@ class ParentAgent(BaseAgent):
             
             return result
         
+        # Drop the A2A client of a deleted agent
+        if tool_name == "manage_agent" and tool_call.args.get("action") == "delete":
+            result = await super().handle_tool_call(tool_call)
+            
+            if result.get("status") == "success":
+                self._drop_client(tool_call.args.get("agent_id"))
+            
+            return result
+        
         # Special handling for communication tool
         if tool_name == "communicate_with_agent":
             # Get parameters
             agent_id = tool_call.args.get("agent_id")
             message = tool_call.args.get("message")
             
-            # Check if we have a client for this agent
-            if agent_id not in self.clients:
-                self._create_a2a_client(agent_id)
+            # Get or create a client for this agent
+            client = self._get_client(agent_id)
             
             # Send the message
-            if agent_id in self.clients:
-                client = self.clients[agent_id]
+            if client is not None:
                 response = await client.send_message(message)
                 
                 # Extract the response text
-                if "result" in response and "messages" in response["result"]:
-                    messages = response["result"]["messages"]
-                    if len(messages) > 1 and "parts" in messages[-1]:
-                        parts = messages[-1]["parts"]
-                        for part in parts:
-                            if part.get("type") == "text":
-                                return {"response": part.get("text", "")}
+                text = _extract_text(response)
+                if text is not None:
+                    return {"response": text}
                 
                 # Return the raw response if we couldn't extract text
                 return {"response": str(response)}
@@ -161,7 +199,34 @@ class ParentAgent(BaseAgent):
         # Default handling for other tools
         return await super().handle_tool_call(tool_call)
     
-    def _create_a2a_client(self, agent_id: str) -> bool:
+    @classmethod
+    def _agent_url_prefix(cls) -> str:
+        """
+        Get the URL prefix for agent A2A endpoints.
+        
+        Returns:
+            Prefix to which an agent ID is appended
+        """
+        if cls._AGENT_URL_PREFIX is None:
+            cls._AGENT_URL_PREFIX = Config.A2A_ENDPOINT + "/agents/"
+        
+        return cls._AGENT_URL_PREFIX
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP connection pool shared by the A2A clients, creating it if needed.
+        
+        Returns:
+            Shared HTTP client
+        """
+        with self._clients_lock:
+            if self._http is None:
+                self._http = httpx.AsyncClient(
+                    limits=httpx.Limits(max_keepalive_connections=64)
+                )
+            return self._http
+    
+    def _create_a2a_client(self, agent_id: str) -> Optional[A2AClient]:
         """
         Create an A2A client for an agent.
         
@@ -169,30 +234,80 @@ class ParentAgent(BaseAgent):
             agent_id: ID of the agent
         
         Returns:
-            True if the client was created, False otherwise
+            The new A2A client, or None if it couldn't be created
         """
         try:
             # Get the agent information
             agent = self.registry.get_agent(agent_id)
             if not agent:
                 logger.warning(f"Attempted to create A2A client for non-existent agent: {agent_id}")
-                return False
+                return None
             
             # Create the client
             client = A2AClient(
-                base_url=f"{Config.A2A_ENDPOINT}/agents/{agent_id}",
-                api_key=Config.API_KEY
+                base_url=self._agent_url_prefix() + agent_id,
+                api_key=Config.API_KEY,
+                client=self._get_http()
             )
             
-            # Store the client
-            self.clients[agent_id] = client
+            # Store the client, evicting the least recently used ones
+            with self._clients_lock:
+                self.clients[agent_id] = client
+                self.clients.move_to_end(agent_id)
+                while len(self.clients) > Config.A2A_CLIENT_CACHE_SIZE:
+                    self.clients.popitem(last=False)
             
             logger.info(f"Created A2A client for agent: {agent['name']} ({agent_id})")
             
-            return True
+            return client
         except Exception as e:
             logger.error(f"Failed to create A2A client for agent {agent_id}: {e}")
-            return False
+            return None
+    
+    def _get_client(self, agent_id: str) -> Optional[A2AClient]:
+        """
+        Get the A2A client for an agent, creating it if needed.
+        
+        Args:
+            agent_id: ID of the agent
+        
+        Returns:
+            A2A client or None if it couldn't be created
+        """
+        with self._clients_lock:
+            client = self.clients.get(agent_id)
+            if client is not None:
+                self.clients.move_to_end(agent_id)
+                return client
+        
+        # Return the client we built, even if it has already been evicted
+        return self._create_a2a_client(agent_id)
+    
+    def _drop_client(self, agent_id: Optional[str]) -> None:
+        """
+        Forget the A2A client for an agent.
+        
+        Args:
+            agent_id: ID of the agent
+        """
+        if agent_id is None:
+            return
+        
+        with self._clients_lock:
+            self.clients.pop(agent_id, None)
+    
+    async def aclose(self) -> None:
+        """
+        Close the HTTP connection pool shared by this agent's A2A clients.
+        """
+        http = None
+        with self._clients_lock:
+            self.clients.clear()
+            if self._owns_http:
+                http, self._http = self._http, None
+        
+        if http is not None:
+            await http.aclose()
     
     async def get_agent_response(self, agent_id: str, message: str) -> str:
         """
@@ -209,25 +324,18 @@ class ParentAgent(BaseAgent):
             ValueError: If the agent doesn't exist or if communication fails
         """
         # Ensure we have a client for this agent
-        if agent_id not in self.clients:
-            if not self._create_a2a_client(agent_id):
-                raise ValueError(f"Failed to create A2A client for agent {agent_id}")
-        
-        # Get the client
-        client = self.clients[agent_id]
+        client = self._get_client(agent_id)
+        if client is None:
+            raise ValueError(f"Failed to create A2A client for agent {agent_id}")
         
         try:
             # Send the message
             response = await client.send_message(message)
             
             # Extract the response text
-            if "result" in response and "messages" in response["result"]:
-                messages = response["result"]["messages"]
-                if len(messages) > 1 and "parts" in messages[-1]:
-                    parts = messages[-1]["parts"]
-                    for part in parts:
-                        if part.get("type") == "text":
-                            return part.get("text", "")
+            text = _extract_text(response)
+            if text is not None:
+                return text
             
             # Return the raw response if we couldn't extract text
             return str(response)
@@ -235,6 +343,78 @@ class ParentAgent(BaseAgent):
             logger.error(f"Failed to get response from agent {agent_id}: {e}")
             raise ValueError(f"Failed to communicate with agent {agent_id}: {str(e)}")
     
+    async def stream_agent_response(self, agent_id: str, message: str) -> AsyncGenerator[str, None]:
+        """
+        Stream a response from an agent as it is generated.
+        
+        Args:
+            agent_id: ID of the agent
+            message: Message to send
+        
+        Yields:
+            Pieces of the agent's response text, in order
+        
+        Raises:
+            ValueError: If the agent doesn't exist or if communication fails
+        """
+        # Ensure we have a client for this agent
+        client = self._get_client(agent_id)
+        if client is None:
+            raise ValueError(f"Failed to create A2A client for agent {agent_id}")
+        
+        try:
+            # send_message returns an event stream when stream=True
+            events = cast(AsyncGenerator[Dict[str, Any], None], await client.send_message(message, stream=True))
+            
+            # Each event carries the whole text so far, so yield only what's new
+            sent = ""
+            async for event in events:
+                text = _extract_text(event)
+                if not text or text == sent:
+                    continue
+                
+                if text.startswith(sent):
+                    yield text[len(sent):]
+                else:
+                    yield text
+                sent = text
+        except Exception as e:
+            logger.error(f"Failed to stream response from agent {agent_id}: {e}")
+            raise ValueError(f"Failed to communicate with agent {agent_id}: {str(e)}")
+    
+    async def get_agent_responses(
+        self,
+        agent_id: str,
+        messages: List[str],
+        max_concurrency: int = 4,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[str]:
+        """
+        Get responses from an agent to several messages, sent concurrently.
+        
+        Args:
+            agent_id: ID of the agent
+            messages: Messages to send
+            max_concurrency: Maximum number of messages in flight at once, to
+                stay clear of provider rate limits
+            semaphore: Optional semaphore to gate the messages with instead,
+                e.g. one shared by every call to the same provider
+        
+        Returns:
+            Agent's responses, in the order of the messages
+        
+        Raises:
+            ValueError: If the agent doesn't exist or if communication fails
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(message: str) -> str:
+            async with semaphore:
+                return await self.get_agent_response(agent_id, message)
+        
+        return await asyncio.gather(*(bounded(message) for message in messages))
+    
     async def create_agent_and_get_response(
         self,
         name: str,
@@ -256,8 +436,9 @@ class ParentAgent(BaseAgent):
         Returns:
             Dictionary with agent ID and response
         """
-        # Create the agent
-        agent_info = self.factory.create_agent(
+        # Create the agent, off the event loop since registration does disk I/O
+        agent_info = await asyncio.to_thread(
+            self.factory.create_agent,
             name=name,
             description=description,
             skills=skills,
@@ -282,6 +463,30 @@ class ParentAgent(BaseAgent):
                 "error": str(e)
             }
     
+    async def _collect_agent_response(self, agent_id: str, agent_name: str, message: str) -> Dict[str, Any]:
+        """
+        Get a response from an agent as a result entry, capturing any error.
+        
+        Args:
+            agent_id: ID of the agent
+            agent_name: Name of the agent
+            message: Message to send
+        
+        Returns:
+            Dictionary with the agent name and either its response or an error
+        """
+        try:
+            response = await self.get_agent_response(agent_id, message)
+            return {
+                "name": agent_name,
+                "response": response
+            }
+        except Exception as e:
+            return {
+                "name": agent_name,
+                "error": str(e)
+            }
+    
     async def handle_multi_agent_task(
         self,
         task_description: str,
@@ -314,33 +519,35 @@ class ParentAgent(BaseAgent):
         if not agents:
             agents = self.registry.get_active_agents()
         
-        # Create tasks for each agent
-        tasks = []
-        for agent in agents:
-            agent_id = agent["id"]
-            
-            # Ensure we have a client
-            if agent_id not in self.clients:
-                self._create_a2a_client(agent_id)
-            
-            if agent_id in self.clients:
-                # Create a task to get a response from this agent
-                task = self.get_agent_response(agent_id, task_description)
-                tasks.append((agent_id, agent["name"], task))
+        # Message each selected agent once
+        targets = list({agent["id"]: agent["name"] for agent in agents}.items())
+        
+        # Create any missing clients in one concurrent batch; each call below
+        # still gets or creates its own client, so an eviction can't skip one
+        missing = [agent_id for agent_id, _ in targets if agent_id not in self.clients]
+        if missing:
+            await asyncio.gather(
+                *(asyncio.to_thread(self._create_a2a_client, agent_id) for agent_id in missing)
+            )
         
         # Execute all tasks concurrently
-        results = {}
-        for agent_id, agent_name, task in tasks:
-            try:
-                response = await task
-                results[agent_id] = {
-                    "name": agent_name,
-                    "response": response
-                }
-            except Exception as e:
-                results[agent_id] = {
-                    "name": agent_name,
-                    "error": str(e)
-                }
+        if hasattr(asyncio, "TaskGroup"):
+            # Python 3.11+: the wrapper never raises, so no task cancels its siblings
+            async with asyncio.TaskGroup() as group:
+                futures = [
+                    group.create_task(self._collect_agent_response(agent_id, agent_name, task_description))
+                    for agent_id, agent_name in targets
+                ]
+            outcomes = [future.result() for future in futures]
+        else:
+            outcomes = await asyncio.gather(
+                *(self._collect_agent_response(agent_id, agent_name, task_description)
+                  for agent_id, agent_name in targets)
+            )
+        
+        results = {
+            agent_id: outcome
+            for (agent_id, _), outcome in zip(targets, outcomes)
+        }
         
         return results
@@ -1,12 +1,328 @@
-from typing import Dict, List, Any, Optional
-import uuid
+from typing import Dict, List, Any, Callable, Mapping, Optional, Set, Tuple
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 from google.adk.tools import BaseTool
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ..agent_factory import AgentCreationError
+from ..config import Config
+from ..models.model_registry import model_registry
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# JSON Schema for the create_agent tool parameters, shared by all instances
+_CREATE_AGENT_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Name of the agent to create"
+        },
+        "description": {
+            "type": "string",
+            "description": "Description of the agent's purpose and capabilities"
+        },
+        "skills": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of skills or domains the agent should be specialized in"
+        },
+        "model": {
+            "type": "string",
+            "description": "The LLM model to use for this agent (optional)"
+        },
+        "instructions": {
+            "type": "string",
+            "description": "Specific instructions for the agent (optional)"
+        },
+        "mcp_servers": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of MCP servers to connect to (optional)"
+        },
+        "metadata": {
+            "type": "object",
+            "description": "Additional metadata for the agent (optional)"
+        },
+        "examples": {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": {"type": "string"}
+            },
+            "description": "Example queries for each skill (optional)"
+        },
+        "category": {
+            "type": "string",
+            "description": "Category of the agent (e.g., 'productivity', 'creative', 'analysis') (optional)"
+        }
+    },
+    "required": ["name", "description", "skills"]
+}
+
+# JSON Schema for the create_agent_from_template tool parameters
+_CREATE_FROM_TEMPLATE_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "template_id": {
+            "type": "string",
+            "description": "ID of the template to use"
+        },
+        "name": {
+            "type": "string",
+            "description": "Name of the agent to create"
+        },
+        "description": {
+            "type": "string",
+            "description": "Optional custom description (defaults to template description)"
+        },
+        "model": {
+            "type": "string",
+            "description": "Optional custom model (defaults to template model)"
+        },
+        "customizations": {
+            "type": "object",
+            "description": "Additional customizations for the template"
+        }
+    },
+    "required": ["template_id", "name"]
+}
+
+@dataclass(frozen=True)
+class AgentTemplate:
+    """Predefined, immutable description of an agent."""
+    
+    name: str
+    description: str
+    skills: Tuple[str, ...]
+    model: str
+    category: str = "general"
+    mcp_servers: Tuple[str, ...] = ()
+    examples: Tuple[Tuple[str, ...], ...] = ()
+    instructions: Optional[str] = None
+
+# Predefined agent templates.
+# In a real implementation, these would be loaded from a file or database
+_TEMPLATE_DEFINITIONS = {
+    "writer": AgentTemplate(
+        name="Creative Writer",
+        description="An agent specialized in creative writing and content creation",
+        skills=("creative_writing", "storytelling", "content_creation"),
+        model="claude-3-opus-20240229",
+        category="creative",
+        examples=(
+            ("Write a short story about a robot discovering emotions",),
+            ("Create a blog post about sustainable travel",),
+            ("Draft a product description for a new smartphone",)
+        )
+    ),
+    "analyst": AgentTemplate(
+        name="Data Analyst",
+        description="An agent specialized in data analysis and visualization",
+        skills=("data_analysis", "statistics", "visualization"),
+        model="gemini-2.0-pro",
+        category="analysis",
+        mcp_servers=("postgres", "s3"),
+        examples=(
+            ("Analyze this CSV data and find trends",),
+            ("Calculate the correlation between these variables",),
+            ("Create a visualization of this dataset",)
+        )
+    ),
+    "coder": AgentTemplate(
+        name="Code Assistant",
+        description="An agent specialized in software development and code assistance",
+        skills=("programming", "code_review", "debugging"),
+        model="claude-3-opus-20240229",
+        category="development",
+        mcp_servers=("git", "github", "vscode"),
+        examples=(
+            ("Write a Python function to sort a list of dictionaries",),
+            ("Review this code for security vulnerabilities",),
+            ("Help me debug this JavaScript error",)
+        )
+    ),
+    "researcher": AgentTemplate(
+        name="Research Assistant",
+        description="An agent specialized in research and information gathering",
+        skills=("research", "summarization", "fact_checking"),
+        model="gemini-2.0-pro",
+        category="knowledge",
+        examples=(
+            ("Research the impact of climate change on agriculture",),
+            ("Summarize the latest findings on quantum computing",),
+            ("Find credible sources about the history of artificial intelligence",)
+        )
+    ),
+    "assistant": AgentTemplate(
+        name="Personal Assistant",
+        description="An agent specialized in task management and personal assistance",
+        skills=("task_management", "scheduling", "reminders"),
+        model="gemini-2.0-flash",
+        category="productivity",
+        examples=(
+            ("Remind me to call John tomorrow at 3 PM",),
+            ("Schedule a meeting with the team next week",),
+            ("Help me plan my vacation to Europe",)
+        )
+    )
+}
+
+# Summary of each template, enough to list templates without their full bodies
+_TEMPLATE_INDEX = {
+    sys.intern(template_id): {
+        "name": template.name,
+        "description": template.description,
+        "skills": template.skills,
+        "category": template.category
+    }
+    for template_id, template in _TEMPLATE_DEFINITIONS.items()
+}
+
+# Template IDs in definition order, for error responses
+_TEMPLATE_IDS = tuple(_TEMPLATE_INDEX)
+
+# Customization keys that cannot override the template's identity
+_RESERVED_CUST_KEYS = frozenset({"name", "template_id"})
+
+@lru_cache(maxsize=None)
+def _baseline_kwargs(template_id: str) -> MappingProxyType:
+    """
+    Get the agent parameters a template contributes, built once per template.
+    
+    Args:
+        template_id: ID of the template
+    
+    Returns:
+        Read-only mapping of agent parameters, with empty MCP servers as None
+    """
+    template = _TEMPLATE_DEFINITIONS[template_id]
+    return MappingProxyType({
+        "name": template.name,
+        "description": template.description,
+        "skills": template.skills,
+        "model": template.model,
+        "instructions": template.instructions,
+        "mcp_servers": template.mcp_servers or None,
+        "category": template.category,
+        "examples": template.examples
+    })
+
+def _template_kwargs(template_id: str) -> Dict[str, Any]:
+    """
+    Get a fresh copy of a template's agent parameters, with lists for its tuples.
+    
+    Args:
+        template_id: ID of the template
+    
+    Returns:
+        Agent parameters the caller may modify and merge customizations into
+    """
+    baseline = _baseline_kwargs(template_id)
+    mcp_servers = baseline["mcp_servers"]
+    return {
+        **baseline,
+        "skills": list(baseline["skills"]),
+        "mcp_servers": list(mcp_servers) if mcp_servers is not None else None,
+        "examples": [list(example) for example in baseline["examples"]]
+    }
+
+# Interned status values shared by every tool response
+_STATUS_SUCCESS = sys.intern("success")
+_STATUS_ERROR = sys.intern("error")
+
+# Response messages for the creation tools
+_OK_FMT_CREATE = "Agent '{}' created successfully"
+_OK_FMT_TMPL = "Agent '{}' created successfully from template '{}'"
+_ERR_FMT_CREATE = "Failed to create agent: {}"
+_ERR_FMT_TMPL = "Failed to create agent from template: {}"
+_ERR_FMT_NO_TEMPLATE = "Template with ID '{}' not found"
+_ERR_NO_ID = "Failed to create agent: factory returned no id"
+
+def _encode_json(obj: Any) -> bytes:
+    """
+    Encode an object as compact JSON, using orjson when it is installed.
+    
+    Args:
+        obj: Object to encode
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Seconds before the cached MCP server list is refreshed in the background
+_AVAILABLE_TTL = 300.0
+
+# Cached lists keyed by name, with the time they were loaded
+_available_cache: Dict[str, Tuple[float, List[Any]]] = {}
+_refreshing: Set[str] = set()
+_available_lock = threading.Lock()
+
+def _refresh_available(key: str, loader: Callable[[], List[Any]]) -> None:
+    """
+    Reload a cached list, keeping the stale value if loading fails.
+    
+    Args:
+        key: Cache key
+        loader: Function returning the fresh list
+    """
+    try:
+        value = loader()
+        with _available_lock:
+            _available_cache[key] = (time.monotonic(), value)
+    except Exception as e:
+        logger.error("Failed to refresh %s, keeping cached value: %s", key, e)
+    finally:
+        with _available_lock:
+            _refreshing.discard(key)
+
+def _get_available(key: str, loader: Callable[[], List[Any]]) -> List[Any]:
+    """
+    Get a cached list, serving stale values while refreshing in the background.
+    
+    The first call loads synchronously; once the TTL has passed, callers get
+    the cached list immediately and a background thread reloads it.
+    
+    Args:
+        key: Cache key
+        loader: Function returning the fresh list
+    
+    Returns:
+        Copy of the cached list
+    """
+    with _available_lock:
+        entry = _available_cache.get(key)
+        stale = entry is not None and time.monotonic() - entry[0] >= _AVAILABLE_TTL
+        if stale and key not in _refreshing:
+            _refreshing.add(key)
+        else:
+            stale = False
+    
+    if entry is None:
+        value = loader()
+        with _available_lock:
+            _available_cache[key] = (time.monotonic(), value)
+        return list(value)
+    
+    if stale:
+        threading.Thread(target=_refresh_available, args=(key, loader), daemon=True).start()
+    
+    return list(entry[1])
+
 class AgentCreationTool(BaseTool):
     """Tool for creating new agents."""
     
@@ -22,54 +338,7 @@ class AgentCreationTool(BaseTool):
         super().__init__(
             name="create_agent",
             description="Creates a new specialized agent with custom capabilities",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the agent to create"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Description of the agent's purpose and capabilities"
-                    },
-                    "skills": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of skills or domains the agent should be specialized in"
-                    },
-                    "model": {
-                        "type": "string",
-                        "description": "The LLM model to use for this agent (optional)"
-                    },
-                    "instructions": {
-                        "type": "string",
-                        "description": "Specific instructions for the agent (optional)"
-                    },
-                    "mcp_servers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of MCP servers to connect to (optional)"
-                    },
-                    "metadata": {
-                        "type": "object",
-                        "description": "Additional metadata for the agent (optional)"
-                    },
-                    "examples": {
-                        "type": "array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "description": "Example queries for each skill (optional)"
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Category of the agent (e.g., 'productivity', 'creative', 'analysis') (optional)"
-                    }
-                },
-                "required": ["name", "description", "skills"]
-            }
+            parameters=_CREATE_AGENT_PARAMETERS
         )
     
     def run(
@@ -102,63 +371,79 @@ class AgentCreationTool(BaseTool):
             Dict containing the new agent's information
         """
         try:
-            # Prepare metadata
-            full_metadata = metadata or {}
-            if category:
-                full_metadata["category"] = category
-            if examples:
-                full_metadata["examples"] = examples
+            # Prepare metadata, copying so the caller's dict is never modified
+            if metadata is None and not (category or examples):
+                full_metadata = None
+            else:
+                if metadata is not None and not isinstance(metadata, Mapping):
+                    raise AgentCreationError(f"metadata must be an object, not {type(metadata).__name__}")
+                full_metadata = {} if metadata is None else dict(metadata)
+                if category:
+                    full_metadata["category"] = category
+                if examples:
+                    full_metadata["examples"] = examples
             
-            # Create the agent
+            # Create the agent, passing arguments in signature order
             agent_info = self.agent_factory.create_agent(
-                name=name,
-                description=description,
-                skills=skills,
-                model=model,
-                instructions=instructions,
-                mcp_servers=mcp_servers,
-                metadata=full_metadata
+                name,
+                description,
+                skills,
+                model,
+                instructions,
+                mcp_servers,
+                full_metadata
             )
-            
+        except AgentCreationError as e:
+            logger.exception("Failed to create agent '%s': %s", name, e)
             return {
-                "status": "success",
-                "message": f"Agent '{name}' created successfully",
-                "agent_id": agent_info["id"],
-                "agent_details": agent_info
+                "status": _STATUS_ERROR,
+                "message": _ERR_FMT_CREATE.format(e)
             }
-        except Exception as e:
-            logger.error(f"Failed to create agent '{name}': {e}")
+        
+        agent_id = agent_info.get("id")
+        if agent_id is None:
+            logger.error("Factory returned no id for agent '%s'", name)
             return {
-                "status": "error",
-                "message": f"Failed to create agent: {str(e)}"
+                "status": _STATUS_ERROR,
+                "message": _ERR_NO_ID
             }
+        
+        return {
+            "status": _STATUS_SUCCESS,
+            "message": _OK_FMT_CREATE.format(name),
+            "agent_id": agent_id,
+            "agent_details": agent_info
+        }
     
     def get_available_models(self) -> List[Dict[str, Any]]:
         """
         Get a list of available models for creating agents.
         
+        The model registry caches the listing and hands out copies, so it is
+        not cached again here.
+        
         Returns:
             List of model information dictionaries
         """
         try:
-            from ..models.model_registry import model_registry
             return model_registry.list_available_models()
         except Exception as e:
-            logger.error(f"Failed to get available models: {e}")
+            logger.error("Failed to get available models: %s", e)
             return []
     
     def get_available_mcp_servers(self) -> List[str]:
         """
         Get a list of available MCP servers.
         
+        The list is cached and refreshed in the background once it is stale.
+        
         Returns:
             List of MCP server names
         """
         try:
-            from ..config import Config
-            return Config.get_available_mcp_servers()
+            return _get_available("available MCP servers", Config.get_available_mcp_servers)
         except Exception as e:
-            logger.error(f"Failed to get available MCP servers: {e}")
+            logger.error("Failed to get available MCP servers: %s", e)
             return []
     
 class TemplateBasedAgentCreationTool(BaseTool):
@@ -172,112 +457,15 @@ class TemplateBasedAgentCreationTool(BaseTool):
             agent_factory: Factory for creating agents
         """
         self.agent_factory = agent_factory
-        self.templates = self._load_templates()
+        self._template_index = _TEMPLATE_INDEX
+        self._list_templates_json: Optional[bytes] = None
         
         super().__init__(
             name="create_agent_from_template",
             description="Creates a new agent based on a predefined template",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "template_id": {
-                        "type": "string",
-                        "description": "ID of the template to use"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the agent to create"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional custom description (defaults to template description)"
-                    },
-                    "model": {
-                        "type": "string",
-                        "description": "Optional custom model (defaults to template model)"
-                    },
-                    "customizations": {
-                        "type": "object",
-                        "description": "Additional customizations for the template"
-                    }
-                },
-                "required": ["template_id", "name"]
-            }
+            parameters=_CREATE_FROM_TEMPLATE_PARAMETERS
         )
     
-    def _load_templates(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Load predefined agent templates.
-        
-        Returns:
-            Dictionary of templates
-        """
-        # In a real implementation, these would be loaded from a file or database
-        return {
-            "writer": {
-                "name": "Creative Writer",
-                "description": "An agent specialized in creative writing and content creation",
-                "skills": ["creative_writing", "storytelling", "content_creation"],
-                "model": "claude-3-opus-20240229",
-                "category": "creative",
-                "examples": [
-                    ["Write a short story about a robot discovering emotions"],
-                    ["Create a blog post about sustainable travel"],
-                    ["Draft a product description for a new smartphone"]
-                ]
-            },
-            "analyst": {
-                "name": "Data Analyst",
-                "description": "An agent specialized in data analysis and visualization",
-                "skills": ["data_analysis", "statistics", "visualization"],
-                "model": "gemini-2.0-pro",
-                "category": "analysis",
-                "mcp_servers": ["postgres", "s3"],
-                "examples": [
-                    ["Analyze this CSV data and find trends"],
-                    ["Calculate the correlation between these variables"],
-                    ["Create a visualization of this dataset"]
-                ]
-            },
-            "coder": {
-                "name": "Code Assistant",
-                "description": "An agent specialized in software development and code assistance",
-                "skills": ["programming", "code_review", "debugging"],
-                "model": "claude-3-opus-20240229",
-                "category": "development",
-                "mcp_servers": ["git", "github", "vscode"],
-                "examples": [
-                    ["Write a Python function to sort a list of dictionaries"],
-                    ["Review this code for security vulnerabilities"],
-                    ["Help me debug this JavaScript error"]
-                ]
-            },
-            "researcher": {
-                "name": "Research Assistant",
-                "description": "An agent specialized in research and information gathering",
-                "skills": ["research", "summarization", "fact_checking"],
-                "model": "gemini-2.0-pro",
-                "category": "knowledge",
-                "examples": [
-                    ["Research the impact of climate change on agriculture"],
-                    ["Summarize the latest findings on quantum computing"],
-                    ["Find credible sources about the history of artificial intelligence"]
-                ]
-            },
-            "assistant": {
-                "name": "Personal Assistant",
-                "description": "An agent specialized in task management and personal assistance",
-                "skills": ["task_management", "scheduling", "reminders"],
-                "model": "gemini-2.0-flash",
-                "category": "productivity",
-                "examples": [
-                    ["Remind me to call John tomorrow at 3 PM"],
-                    ["Schedule a meeting with the team next week"],
-                    ["Help me plan my vacation to Europe"]
-                ]
-            }
-        }
-    
     def run(
         self,
         template_id: str,
@@ -299,79 +487,98 @@ class TemplateBasedAgentCreationTool(BaseTool):
         Returns:
             Dict containing the new agent's information
         """
+        # Check if the template exists
+        if template_id not in _TEMPLATE_DEFINITIONS:
+            return {
+                "status": _STATUS_ERROR,
+                "message": _ERR_FMT_NO_TEMPLATE.format(template_id),
+                "available_templates": list(_TEMPLATE_IDS)
+            }
+        
+        # Override with custom values if provided
+        overrides = {"name": name}
+        if description:
+            overrides["description"] = description
+        if model:
+            overrides["model"] = model
+        
+        # Create agent parameters by merging the overrides onto the template's
+        agent_params = _template_kwargs(template_id)
+        agent_params.update(overrides)
+        
+        # Additional customizations apply last, except for reserved keys, and
+        # are passed on as given
+        if customizations:
+            for key, value in customizations.items():
+                if key not in _RESERVED_CUST_KEYS:
+                    agent_params[key] = value
+        
         try:
-            # Check if the template exists
-            if template_id not in self.templates:
-                return {
-                    "status": "error",
-                    "message": f"Template with ID '{template_id}' not found",
-                    "available_templates": list(self.templates.keys())
-                }
-            
-            # Get the template
-            template = self.templates[template_id]
-            
-            # Create agent parameters
-            agent_params = template.copy()
-            agent_params["name"] = name
-            
-            # Override with custom values if provided
-            if description:
-                agent_params["description"] = description
-            if model:
-                agent_params["model"] = model
-            
-            # Apply additional customizations
-            if customizations:
-                for key, value in customizations.items():
-                    if key not in ["name", "template_id"]:
-                        agent_params[key] = value
-            
-            # Create the agent
+            # Create the agent, passing arguments in signature order
             agent_info = self.agent_factory.create_agent(
-                name=agent_params["name"],
-                description=agent_params["description"],
-                skills=agent_params["skills"],
-                model=agent_params["model"],
-                instructions=agent_params.get("instructions"),
-                mcp_servers=agent_params.get("mcp_servers"),
-                metadata={
+                agent_params["name"],
+                agent_params["description"],
+                agent_params["skills"],
+                agent_params["model"],
+                agent_params.get("instructions"),
+                agent_params.get("mcp_servers"),
+                {
                     "template_id": template_id,
                     "category": agent_params.get("category"),
                     "examples": agent_params.get("examples")
                 }
             )
-            
+        except AgentCreationError as e:
+            logger.exception("Failed to create agent from template '%s': %s", template_id, e)
             return {
-                "status": "success",
-                "message": f"Agent '{name}' created successfully from template '{template_id}'",
-                "agent_id": agent_info["id"],
-                "agent_details": agent_info
+                "status": _STATUS_ERROR,
+                "message": _ERR_FMT_TMPL.format(e)
             }
-        except Exception as e:
-            logger.error(f"Failed to create agent from template '{template_id}': {e}")
+        
+        agent_id = agent_info.get("id")
+        if agent_id is None:
+            logger.error("Factory returned no id for agent '%s' from template '%s'", name, template_id)
             return {
-                "status": "error",
-                "message": f"Failed to create agent from template: {str(e)}"
+                "status": _STATUS_ERROR,
+                "message": _ERR_NO_ID
             }
+        
+        return {
+            "status": _STATUS_SUCCESS,
+            "message": _OK_FMT_TMPL.format(name, template_id),
+            "agent_id": agent_id,
+            "agent_details": agent_info
+        }
     
     def list_templates(self) -> Dict[str, Any]:
         """
         List all available templates.
         
+        Each call returns fresh copies of the summaries; their skills stay
+        tuples, so a response can't be used to mutate the template index.
+        
         Returns:
             Dict containing template information
         """
-        template_summaries = {}
-        for template_id, template in self.templates.items():
-            template_summaries[template_id] = {
-                "name": template["name"],
-                "description": template["description"],
-                "skills": template["skills"],
-                "category": template.get("category", "general")
-            }
-        
         return {
-            "status": "success",
-            "templates": template_summaries
+            "status": _STATUS_SUCCESS,
+            "templates": {
+                template_id: dict(summary)
+                for template_id, summary in self._template_index.items()
+            }
         }
+    
+    def list_templates_bytes(self) -> bytes:
+        """
+        List all available templates as pre-encoded JSON.
+        
+        The payload is encoded once and reused, for callers that accept
+        serialized responses.
+        
+        Returns:
+            JSON-encoded list_templates response
+        """
+        if self._list_templates_json is None:
+            self._list_templates_json = _encode_json(self.list_templates())
+        
+        return self._list_templates_json
@@ -1,5 +1,7 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, ClassVar, Iterable, Iterator, Optional
 import uuid
+from collections import Counter
+from itertools import chain
 
 from google.adk.tools import BaseTool
 
@@ -7,6 +9,171 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# JSON Schema for the manage_agent tool parameters, shared by all instances
+_MANAGE_AGENT_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["list", "get", "update", "delete", "activate", "deactivate"],
+            "description": "The action to perform on agents"
+        },
+        "agent_id": {
+            "type": "string",
+            "description": "ID of the agent (required for 'get', 'update', 'delete', 'activate', and 'deactivate' actions)"
+        },
+        "updates": {
+            "type": "object",
+            "description": "Updates to apply to the agent (for 'update' action)"
+        },
+        "filter_by_skill": {
+            "type": "string",
+            "description": "Filter agents by skill (for 'list' action)"
+        },
+        "filter_by_status": {
+            "type": "string",
+            "description": "Filter agents by status (for 'list' action)"
+        },
+        "filter_by_model": {
+            "type": "string",
+            "description": "Filter agents by model (for 'list' action)"
+        },
+        "filter_by_category": {
+            "type": "string",
+            "description": "Filter agents by category (for 'list' action)"
+        },
+        "search_query": {
+            "type": "string",
+            "description": "Search for agents by name, description, or skills (for 'list' action)"
+        }
+    },
+    "required": ["action"]
+}
+
+# JSON Schema for the agent_stats tool parameters
+_AGENT_STATS_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "stat_type": {
+            "type": "string",
+            "enum": ["count", "skill_distribution", "model_distribution", "status_distribution", "category_distribution"],
+            "description": "Type of statistics to retrieve"
+        },
+        "filter_by_skill": {
+            "type": "string",
+            "description": "Filter agents by skill (optional)"
+        },
+        "filter_by_status": {
+            "type": "string",
+            "description": "Filter agents by status (optional)"
+        },
+        "filter_by_model": {
+            "type": "string",
+            "description": "Filter agents by model (optional)"
+        },
+        "filter_by_category": {
+            "type": "string",
+            "description": "Filter agents by category (optional)"
+        }
+    },
+    "required": ["stat_type"]
+}
+
+# Actions that operate on a single agent and so need an agent_id
+_REQUIRES_ID = frozenset(("get", "update", "delete", "activate", "deactivate"))
+
+# Error messages for the management tool, built once
+_ERR_AGENT_ID_REQUIRED = {
+    action: f"agent_id is required for '{action}' action"
+    for action in _REQUIRES_ID
+}
+_ERR_UPDATES_REQUIRED = "updates are required for 'update' action"
+_ERR_FMT_NOT_FOUND = "Agent with ID '{}' not found"
+
+def _agent_not_found(agent_id: str) -> Dict[str, Any]:
+    """
+    Build the error response for an unknown agent.
+    
+    Args:
+        agent_id: ID of the agent
+    
+    Returns:
+        Error response
+    """
+    return {
+        "status": "error",
+        "message": _ERR_FMT_NOT_FOUND.format(agent_id)
+    }
+
+def _change_result(agent_id: str, success: bool, verb: str) -> Dict[str, Any]:
+    """
+    Build the response for an action that changes an agent.
+    
+    Args:
+        agent_id: ID of the agent
+        success: Whether the agent was found and changed
+        verb: Past tense of the action, e.g. 'deleted'
+    
+    Returns:
+        Success or error response
+    """
+    if not success:
+        return _agent_not_found(agent_id)
+    
+    return {
+        "status": "success",
+        "message": f"Agent '{agent_id}' {verb} successfully"
+    }
+
+# Stat types answered from the aggregated distributions
+_DISTRIBUTION_TYPES = frozenset((
+    "skill_distribution",
+    "model_distribution",
+    "status_distribution",
+    "category_distribution"
+))
+
+def _where(agents: Iterable[Dict[str, Any]], field: str, value: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily select the agents whose field has a given value.
+    
+    Args:
+        agents: Agents to filter
+        field: Agent field to check
+        value: Value the field must have
+    
+    Returns:
+        Iterator over the matching agents
+    """
+    return (agent for agent in agents if agent.get(field) == value)
+
+def _aggregate_all(agents: List[Dict[str, Any]]) -> Dict[str, Counter]:
+    """
+    Count skills, models, statuses and categories of agents in one pass.
+    
+    Args:
+        agents: Agents to aggregate
+    
+    Returns:
+        Dictionary mapping each distribution stat type to its counter
+    """
+    skill_counts = Counter(chain.from_iterable(agent.get("skills") or () for agent in agents))
+    model_counts: Counter[str] = Counter()
+    status_counts: Counter[str] = Counter()
+    category_counts: Counter[str] = Counter()
+    
+    for agent in agents:
+        model_counts[agent.get("model", "unknown")] += 1
+        status_counts[agent.get("status", "unknown")] += 1
+        category_counts[agent.get("category", "unknown")] += 1
+    
+    return {
+        "skill_distribution": skill_counts,
+        "model_distribution": model_counts,
+        "status_distribution": status_counts,
+        "category_distribution": category_counts
+    }
+
 class AgentManagementTool(BaseTool):
     """Tool for managing existing agents."""
     
@@ -24,45 +191,7 @@ class AgentManagementTool(BaseTool):
         super().__init__(
             name="manage_agent",
             description="Manages existing agents - list, get details, update, or delete",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["list", "get", "update", "delete", "activate", "deactivate"],
-                        "description": "The action to perform on agents"
-                    },
-                    "agent_id": {
-                        "type": "string",
-                        "description": "ID of the agent (required for 'get', 'update', 'delete', 'activate', and 'deactivate' actions)"
-                    },
-                    "updates": {
-                        "type": "object",
-                        "description": "Updates to apply to the agent (for 'update' action)"
-                    },
-                    "filter_by_skill": {
-                        "type": "string",
-                        "description": "Filter agents by skill (for 'list' action)"
-                    },
-                    "filter_by_status": {
-                        "type": "string",
-                        "description": "Filter agents by status (for 'list' action)"
-                    },
-                    "filter_by_model": {
-                        "type": "string",
-                        "description": "Filter agents by model (for 'list' action)"
-                    },
-                    "filter_by_category": {
-                        "type": "string",
-                        "description": "Filter agents by category (for 'list' action)"
-                    },
-                    "search_query": {
-                        "type": "string",
-                        "description": "Search for agents by name, description, or skills (for 'list' action)"
-                    }
-                },
-                "required": ["action"]
-            }
+            parameters=_MANAGE_AGENT_PARAMETERS
         )
     
     def run(
@@ -93,143 +222,167 @@ class AgentManagementTool(BaseTool):
             Result of the action
         """
         try:
-            if action == "list":
-                # Apply filters based on the provided parameters
-                if filter_by_skill:
-                    agents = self.registry.get_agents_by_skill(filter_by_skill)
-                elif filter_by_status:
-                    agents = self.registry.get_agents_by_status(filter_by_status)
-                elif filter_by_model:
-                    agents = self.registry.get_agents_by_model(filter_by_model)
-                elif filter_by_category:
-                    agents = self.registry.get_agents_by_category(filter_by_category)
-                elif search_query:
-                    agents = self.registry.search_agents(search_query)
-                else:
-                    agents = self.registry.list_agents()
-                
-                return {
-                    "status": "success",
-                    "count": len(agents),
-                    "agents": agents
-                }
-            
-            elif action == "get":
-                if not agent_id:
-                    return {
-                        "status": "error",
-                        "message": "agent_id is required for 'get' action"
-                    }
-                
-                agent_info = self.registry.get_agent(agent_id)
-                if not agent_info:
-                    return {
-                        "status": "error",
-                        "message": f"Agent with ID '{agent_id}' not found"
-                    }
-                
+            handler = self._ACTIONS.get(action)
+            if handler is None:
                 return {
-                    "status": "success",
-                    "agent": agent_info
+                    "status": "error",
+                    "message": f"Unknown action: {action}"
                 }
             
-            elif action == "update":
-                if not agent_id:
-                    return {
-                        "status": "error",
-                        "message": "agent_id is required for 'update' action"
-                    }
-                
-                if not updates:
-                    return {
-                        "status": "error",
-                        "message": "updates are required for 'update' action"
-                    }
-                
-                updated_agent = self.agent_factory.update_agent(agent_id, updates)
-                if not updated_agent:
-                    return {
-                        "status": "error",
-                        "message": f"Agent with ID '{agent_id}' not found"
-                    }
-                
+            if action in _REQUIRES_ID and not agent_id:
                 return {
-                    "status": "success",
-                    "message": f"Agent '{agent_id}' updated successfully",
-                    "agent": updated_agent
+                    "status": "error",
+                    "message": _ERR_AGENT_ID_REQUIRED[action]
                 }
             
-            elif action == "delete":
-                if not agent_id:
-                    return {
-                        "status": "error",
-                        "message": "agent_id is required for 'delete' action"
-                    }
-                
-                success = self.agent_factory.delete_agent(agent_id)
-                
-                if success:
-                    return {
-                        "status": "success",
-                        "message": f"Agent '{agent_id}' deleted successfully"
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "message": f"Agent with ID '{agent_id}' not found"
-                    }
-            
-            elif action == "activate":
-                if not agent_id:
-                    return {
-                        "status": "error",
-                        "message": "agent_id is required for 'activate' action"
-                    }
-                
-                success = self.agent_factory.activate_agent(agent_id)
-                
-                if success:
-                    return {
-                        "status": "success",
-                        "message": f"Agent '{agent_id}' activated successfully"
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "message": f"Agent with ID '{agent_id}' not found"
-                    }
-            
-            elif action == "deactivate":
-                if not agent_id:
-                    return {
-                        "status": "error",
-                        "message": "agent_id is required for 'deactivate' action"
-                    }
-                
-                success = self.agent_factory.deactivate_agent(agent_id)
-                
-                if success:
-                    return {
-                        "status": "success",
-                        "message": f"Agent '{agent_id}' deactivated successfully"
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "message": f"Agent with ID '{agent_id}' not found"
-                    }
+            filters = {
+                "filter_by_skill": filter_by_skill,
+                "filter_by_status": filter_by_status,
+                "filter_by_model": filter_by_model,
+                "filter_by_category": filter_by_category,
+                "search_query": search_query
+            }
             
-            else:
-                return {
-                    "status": "error",
-                    "message": f"Unknown action: {action}"
-                }
+            return handler(self, agent_id, updates, filters)
         except Exception as e:
             logger.error(f"Error in agent management tool: {e}")
             return {
                 "status": "error",
                 "message": f"Error: {str(e)}"
             }
+    
+    def _do_list(self, agent_id: Optional[str], updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        List agents, narrowed by the first filter given.
+        
+        Args:
+            agent_id: Unused
+            updates: Unused
+            filters: Filters and search query for the list
+            
+        Returns:
+            Matching agents and their count
+        """
+        # Apply filters based on the provided parameters
+        if filters["filter_by_skill"]:
+            agents = self.registry.get_agents_by_skill(filters["filter_by_skill"])
+        elif filters["filter_by_status"]:
+            agents = self.registry.get_agents_by_status(filters["filter_by_status"])
+        elif filters["filter_by_model"]:
+            agents = self.registry.get_agents_by_model(filters["filter_by_model"])
+        elif filters["filter_by_category"]:
+            agents = self.registry.get_agents_by_category(filters["filter_by_category"])
+        elif filters["search_query"]:
+            agents = self.registry.search_agents(filters["search_query"])
+        else:
+            agents = self.registry.list_agents()
+        
+        return {
+            "status": "success",
+            "count": len(agents),
+            "agents": agents
+        }
+    
+    def _do_get(self, agent_id: str, updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Get the details of an agent.
+        
+        Args:
+            agent_id: ID of the agent
+            updates: Unused
+            filters: Unused
+            
+        Returns:
+            The agent's information
+        """
+        agent_info = self.registry.get_agent(agent_id)
+        if not agent_info:
+            return _agent_not_found(agent_id)
+        
+        return {
+            "status": "success",
+            "agent": agent_info
+        }
+    
+    def _do_update(self, agent_id: str, updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Apply updates to an agent.
+        
+        Args:
+            agent_id: ID of the agent
+            updates: Updates to apply to the agent
+            filters: Unused
+            
+        Returns:
+            The updated agent's information
+        """
+        if not updates:
+            return {
+                "status": "error",
+                "message": _ERR_UPDATES_REQUIRED
+            }
+        
+        updated_agent = self.agent_factory.update_agent(agent_id, updates)
+        if not updated_agent:
+            return _agent_not_found(agent_id)
+        
+        return {
+            "status": "success",
+            "message": f"Agent '{agent_id}' updated successfully",
+            "agent": updated_agent
+        }
+    
+    def _do_delete(self, agent_id: str, updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Delete an agent.
+        
+        Args:
+            agent_id: ID of the agent
+            updates: Unused
+            filters: Unused
+            
+        Returns:
+            Outcome of the deletion
+        """
+        return _change_result(agent_id, self.agent_factory.delete_agent(agent_id), "deleted")
+    
+    def _do_activate(self, agent_id: str, updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Activate an agent.
+        
+        Args:
+            agent_id: ID of the agent
+            updates: Unused
+            filters: Unused
+            
+        Returns:
+            Outcome of the activation
+        """
+        return _change_result(agent_id, self.agent_factory.activate_agent(agent_id), "activated")
+    
+    def _do_deactivate(self, agent_id: str, updates: Optional[Dict[str, Any]], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Deactivate an agent.
+        
+        Args:
+            agent_id: ID of the agent
+            updates: Unused
+            filters: Unused
+            
+        Returns:
+            Outcome of the deactivation
+        """
+        return _change_result(agent_id, self.agent_factory.deactivate_agent(agent_id), "deactivated")
+    
+    # Handler for each action, called with the tool as the first argument
+    _ACTIONS: ClassVar[Dict[str, Callable[..., Dict[str, Any]]]] = {
+        "list": _do_list,
+        "get": _do_get,
+        "update": _do_update,
+        "delete": _do_delete,
+        "activate": _do_activate,
+        "deactivate": _do_deactivate
+    }
 
 class AgentStatsTool(BaseTool):
     """Tool for getting statistics about agents."""
@@ -243,36 +396,14 @@ class AgentStatsTool(BaseTool):
         """
         self.registry = registry
         
+        # Distributions per filter combination, valid for one registry revision
+        self._distributions_cache: Dict[tuple, Dict[str, Counter]] = {}
+        self._distributions_revision: Optional[int] = None
+        
         super().__init__(
             name="agent_stats",
             description="Get statistics about agents in the registry",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "stat_type": {
-                        "type": "string",
-                        "enum": ["count", "skill_distribution", "model_distribution", "status_distribution", "category_distribution"],
-                        "description": "Type of statistics to retrieve"
-                    },
-                    "filter_by_skill": {
-                        "type": "string",
-                        "description": "Filter agents by skill (optional)"
-                    },
-                    "filter_by_status": {
-                        "type": "string",
-                        "description": "Filter agents by status (optional)"
-                    },
-                    "filter_by_model": {
-                        "type": "string",
-                        "description": "Filter agents by model (optional)"
-                    },
-                    "filter_by_category": {
-                        "type": "string",
-                        "description": "Filter agents by category (optional)"
-                    }
-                },
-                "required": ["stat_type"]
-            }
+            parameters=_AGENT_STATS_PARAMETERS
         )
     
     def run(
@@ -297,63 +428,31 @@ class AgentStatsTool(BaseTool):
             Statistics about agents
         """
         try:
-            # Get agents based on filters
-            agents = self._get_filtered_agents(
-                filter_by_skill,
-                filter_by_status,
-                filter_by_model,
-                filter_by_category
-            )
-            
-            # Calculate statistics
             if stat_type == "count":
-                return {
-                    "status": "success",
-                    "count": len(agents)
-                }
-            
-            elif stat_type == "skill_distribution":
-                skill_counts = {}
-                for agent in agents:
-                    for skill in agent.get("skills", []):
-                        skill_counts[skill] = skill_counts.get(skill, 0) + 1
-                
-                return {
-                    "status": "success",
-                    "skill_distribution": skill_counts
-                }
-            
-            elif stat_type == "model_distribution":
-                model_counts = {}
-                for agent in agents:
-                    model = agent.get("model", "unknown")
-                    model_counts[model] = model_counts.get(model, 0) + 1
-                
-                return {
-                    "status": "success",
-                    "model_distribution": model_counts
-                }
-            
-            elif stat_type == "status_distribution":
-                status_counts = {}
-                for agent in agents:
-                    status = agent.get("status", "unknown")
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                # Get agents based on filters
+                agents = self._get_filtered_agents(
+                    filter_by_skill,
+                    filter_by_status,
+                    filter_by_model,
+                    filter_by_category
+                )
                 
                 return {
                     "status": "success",
-                    "status_distribution": status_counts
+                    "count": len(agents)
                 }
             
-            elif stat_type == "category_distribution":
-                category_counts = {}
-                for agent in agents:
-                    category = agent.get("category", "unknown")
-                    category_counts[category] = category_counts.get(category, 0) + 1
+            elif stat_type in _DISTRIBUTION_TYPES:
+                distributions = self._get_distributions(
+                    filter_by_skill,
+                    filter_by_status,
+                    filter_by_model,
+                    filter_by_category
+                )
                 
                 return {
                     "status": "success",
-                    "category_distribution": category_counts
+                    stat_type: dict(distributions[stat_type])
                 }
             
             else:
@@ -368,6 +467,40 @@ class AgentStatsTool(BaseTool):
                 "message": f"Error: {str(e)}"
             }
     
+    def _get_distributions(
+        self,
+        filter_by_skill: Optional[str] = None,
+        filter_by_status: Optional[str] = None,
+        filter_by_model: Optional[str] = None,
+        filter_by_category: Optional[str] = None
+    ) -> Dict[str, Counter]:
+        """
+        Get all distributions for the filtered agents, reusing them while the
+        registry is unchanged.
+        
+        Args:
+            filter_by_skill: Filter agents by skill (optional)
+            filter_by_status: Filter agents by status (optional)
+            filter_by_model: Filter agents by model (optional)
+            filter_by_category: Filter agents by category (optional)
+            
+        Returns:
+            Dictionary mapping each distribution stat type to its counter
+        """
+        # Drop everything computed before the registry last changed
+        revision = self.registry.revision
+        if revision != self._distributions_revision:
+            self._distributions_cache.clear()
+            self._distributions_revision = revision
+        
+        key = (filter_by_skill, filter_by_status, filter_by_model, filter_by_category)
+        distributions = self._distributions_cache.get(key)
+        if distributions is None:
+            distributions = _aggregate_all(self._get_filtered_agents(*key))
+            self._distributions_cache[key] = distributions
+        
+        return distributions
+    
     def _get_filtered_agents(
         self,
         filter_by_skill: Optional[str] = None,
@@ -387,32 +520,31 @@ class AgentStatsTool(BaseTool):
         Returns:
             List of filtered agents
         """
-        # Start with all agents
-        agents = self.registry.list_agents()
-        
-        # Apply filters
-        if filter_by_skill:
-            agents = [
-                agent for agent in agents
-                if "skills" in agent and filter_by_skill in agent["skills"]
-            ]
+        # Filters checked against agent fields once the candidates are seeded
+        field_filters = [
+            ("status", filter_by_status),
+            ("model", filter_by_model)
+        ]
         
-        if filter_by_status:
-            agents = [
-                agent for agent in agents
-                if "status" in agent and agent["status"] == filter_by_status
-            ]
-        
-        if filter_by_model:
-            agents = [
-                agent for agent in agents
-                if "model" in agent and agent["model"] == filter_by_model
-            ]
+        # Seed the candidates from the indexes, or else the first filter the
+        # registry can look up
+        if filter_by_skill or filter_by_category:
+            agents = self.registry.get_agents_by_skill_and_category(
+                filter_by_skill or None,
+                filter_by_category or None
+            )
+        elif filter_by_status:
+            agents = self.registry.get_agents_by_status(filter_by_status)
+            field_filters = field_filters[1:]
+        elif filter_by_model:
+            agents = self.registry.get_agents_by_model(filter_by_model)
+            field_filters = []
+        else:
+            return list(self.registry.iter_agents())
         
-        if filter_by_category:
-            agents = [
-                agent for agent in agents
-                if "category" in agent and agent["category"] == filter_by_category
-            ]
+        # Chain the remaining filters lazily so only the final list is built
+        for field, value in field_filters:
+            if value:
+                agents = _where(agents, field, value)
         
-        return agents
+        return list(agents)
@@ -1,6 +1,9 @@
 from typing import Dict, List, Any, Optional
 import asyncio
+import threading
+from collections import OrderedDict
 
+import httpx
 from google.adk.tools import BaseTool
 
 from ..utils.logging import get_logger
@@ -9,6 +12,145 @@ from ..config import Config
 
 logger = get_logger(__name__)
 
+# JSON Schema for the communicate_with_agent tool parameters, shared by all instances
+_COMMUNICATE_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "agent_id": {
+            "type": "string",
+            "description": "ID of the agent to communicate with"
+        },
+        "message": {
+            "type": "string",
+            "description": "Message to send to the agent"
+        },
+        "stream": {
+            "type": "boolean",
+            "description": "Whether to stream the response (optional, defaults to false)"
+        },
+        "include_file": {
+            "type": "boolean",
+            "description": "Whether to include a file in the message (optional, defaults to false)"
+        },
+        "file_data": {
+            "type": "object",
+            "description": "File data to include (required if include_file is true)"
+        }
+    },
+    "required": ["agent_id", "message"]
+}
+
+# JSON Schema for the communicate_with_multiple_agents tool parameters
+_COMMUNICATE_MULTIPLE_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "message": {
+            "type": "string",
+            "description": "Message to send to the agents"
+        },
+        "agent_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "IDs of the agents to communicate with"
+        },
+        "filter_by_skill": {
+            "type": "string",
+            "description": "Alternatively, filter agents by skill"
+        },
+        "filter_by_category": {
+            "type": "string",
+            "description": "Alternatively, filter agents by category"
+        },
+        "timeout": {
+            "type": "number",
+            "description": "Timeout in seconds (optional, defaults to 30)"
+        }
+    },
+    "required": ["message"]
+}
+
+def _extract_text(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the first text part of the last message in an A2A response.
+    
+    Args:
+        response: Response from an A2A client
+    
+    Returns:
+        Text of the response, or None if it has no text part
+    """
+    messages = (response.get("result") or {}).get("messages") or []
+    if len(messages) < 2:
+        return None
+    
+    parts = messages[-1].get("parts") or ()
+    return next((part.get("text", "") for part in parts if part.get("type") == "text"), None)
+
+# A2A clients shared by all communication tools, least recently used first
+_clients: "OrderedDict[str, A2AClient]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+# HTTP connection pool shared by those clients, created on first use
+_shared_http: Optional[httpx.AsyncClient] = None
+
+def _get_shared_http() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by all A2A clients of the communication tools.
+    
+    Returns:
+        Shared HTTP client
+    """
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        _shared_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30.0
+        )
+    
+    return _shared_http
+
+async def aclose_shared_clients() -> None:
+    """
+    Drop the cached A2A clients and close their shared HTTP connection pool.
+    """
+    global _shared_http
+    with _clients_lock:
+        _clients.clear()
+    
+    if _shared_http is not None:
+        await _shared_http.aclose()
+        _shared_http = None
+
+def _get_client(agent_id: str) -> A2AClient:
+    """
+    Get or create the shared A2A client for an agent.
+    
+    Args:
+        agent_id: ID of the agent
+    
+    Returns:
+        A2A client
+    """
+    with _clients_lock:
+        client = _clients.get(agent_id)
+        if client is not None:
+            _clients.move_to_end(agent_id)
+            return client
+        
+        client = A2AClient(
+            base_url=f"{Config.A2A_ENDPOINT}/agents/{agent_id}",
+            api_key=Config.API_KEY,
+            client=_get_shared_http()
+        )
+        _clients[agent_id] = client
+        
+        # Evict the least recently used clients once the cache is full; they
+        # only borrow the shared pool, so there is nothing to close
+        while len(_clients) > Config.A2A_CLIENT_CACHE_SIZE:
+            _clients.popitem(last=False)
+    
+    return client
+
 class CommunicationTool(BaseTool):
     """Tool for communicating with other agents."""
     
@@ -20,37 +162,12 @@ class CommunicationTool(BaseTool):
             registry: Registry for looking up agents
         """
         self.registry = registry
-        self.clients = {}  # Cache for A2A clients
+        self.clients = _clients  # Shared LRU cache of A2A clients
         
         super().__init__(
             name="communicate_with_agent",
             description="Send a message to another agent and get their response",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "agent_id": {
-                        "type": "string",
-                        "description": "ID of the agent to communicate with"
-                    },
-                    "message": {
-                        "type": "string",
-                        "description": "Message to send to the agent"
-                    },
-                    "stream": {
-                        "type": "boolean",
-                        "description": "Whether to stream the response (optional, defaults to false)"
-                    },
-                    "include_file": {
-                        "type": "boolean",
-                        "description": "Whether to include a file in the message (optional, defaults to false)"
-                    },
-                    "file_data": {
-                        "type": "object",
-                        "description": "File data to include (required if include_file is true)"
-                    }
-                },
-                "required": ["agent_id", "message"]
-            }
+            parameters=_COMMUNICATE_PARAMETERS
         )
     
     async def run(
@@ -112,28 +229,15 @@ class CommunicationTool(BaseTool):
                     stream=stream
                 )
             
-            # Extract response text
-            if not stream:
-                # For non-streaming responses, extract text from the response
-                if "result" in response and "messages" in response["result"]:
-                    messages = response["result"]["messages"]
-                    if len(messages) > 1 and "parts" in messages[-1]:
-                        parts = messages[-1]["parts"]
-                        for part in parts:
-                            if part.get("type") == "text":
-                                return {
-                                    "status": "success",
-                                    "agent_id": agent_id,
-                                    "agent_name": agent.get("name", "Agent"),
-                                    "response": part.get("text", "")
-                                }
+            # For non-streaming responses, extract text from the response
+            text = None if stream else _extract_text(response)
             
-            # Return the raw response
+            # Fall back to the raw response if there is no text
             return {
                 "status": "success",
                 "agent_id": agent_id,
                 "agent_name": agent.get("name", "Agent"),
-                "response": str(response)
+                "response": text if text is not None else str(response)
             }
         except Exception as e:
             logger.error(f"Error communicating with agent {agent_id}: {e}")
@@ -152,13 +256,7 @@ class CommunicationTool(BaseTool):
         Returns:
             A2A client
         """
-        if agent_id not in self.clients:
-            self.clients[agent_id] = A2AClient(
-                base_url=f"{Config.A2A_ENDPOINT}/agents/{agent_id}",
-                api_key=Config.API_KEY
-            )
-        
-        return self.clients[agent_id]
+        return _get_client(agent_id)
 
 class MultiAgentCommunicationTool(BaseTool):
     """Tool for communicating with multiple agents simultaneously."""
@@ -171,38 +269,12 @@ class MultiAgentCommunicationTool(BaseTool):
             registry: Registry for looking up agents
         """
         self.registry = registry
-        self.clients = {}  # Cache for A2A clients
+        self.clients = _clients  # Shared LRU cache of A2A clients
         
         super().__init__(
             name="communicate_with_multiple_agents",
             description="Send a message to multiple agents and get their responses",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Message to send to the agents"
-                    },
-                    "agent_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "IDs of the agents to communicate with"
-                    },
-                    "filter_by_skill": {
-                        "type": "string",
-                        "description": "Alternatively, filter agents by skill"
-                    },
-                    "filter_by_category": {
-                        "type": "string",
-                        "description": "Alternatively, filter agents by category"
-                    },
-                    "timeout": {
-                        "type": "number",
-                        "description": "Timeout in seconds (optional, defaults to 30)"
-                    }
-                },
-                "required": ["message"]
-            }
+            parameters=_COMMUNICATE_MULTIPLE_PARAMETERS
         )
     
     async def run(
@@ -231,11 +303,15 @@ class MultiAgentCommunicationTool(BaseTool):
             agents = []
             
             if agent_ids:
-                # Get agents by IDs
-                for agent_id in agent_ids:
-                    agent = self.registry.get_agent(agent_id)
-                    if agent:
-                        agents.append(agent)
+                # Get agents by IDs, in one registry call when it supports it
+                get_agents = getattr(self.registry, "get_agents", None)
+                if get_agents is not None:
+                    agents = list(get_agents(agent_ids).values())
+                else:
+                    for agent_id in agent_ids:
+                        agent = self.registry.get_agent(agent_id)
+                        if agent:
+                            agents.append(agent)
             elif filter_by_skill:
                 # Get agents by skill
                 agents = self.registry.get_agents_by_skill(filter_by_skill)
@@ -252,41 +328,22 @@ class MultiAgentCommunicationTool(BaseTool):
                     "message": "No matching agents found"
                 }
             
-            # Create tasks for each agent
-            tasks = []
-            for agent in agents:
-                client = self._get_client(agent["id"])
-                tasks.append(self._send_message_to_agent(client, agent, message))
+            # Pair each agent with its client
+            targets = [(self._get_client(agent["id"]), agent) for agent in agents]
+            
+            # Run tasks concurrently, each under its own timeout, so slow
+            # agents can't take the other responses down with them
+            results = await asyncio.gather(
+                *(self._send_with_timeout(client, agent, message, timeout) for client, agent in targets),
+                return_exceptions=True
+            )
             
-            # Run tasks concurrently with timeout
             responses = {}
-            try:
-                done, pending = await asyncio.wait(
-                    tasks,
-                    timeout=timeout,
-                    return_when=asyncio.ALL_COMPLETED
-                )
-                
-                # Process completed tasks
-                for task in done:
-                    try:
-                        result = task.result()
-                        responses[result["agent_id"]] = {
-                            "agent_name": result["agent_name"],
-                            "response": result["response"]
-                        }
-                    except Exception as e:
-                        logger.error(f"Error processing task result: {e}")
-                
-                # Cancel pending tasks
-                for task in pending:
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            except asyncio.TimeoutError:
-                logger.warning("Multi-agent communication timed out")
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing task result: {result}")
+                    continue
+                self._record_response(responses, result)
             
             return {
                 "status": "success",
@@ -310,13 +367,52 @@ class MultiAgentCommunicationTool(BaseTool):
         Returns:
             A2A client
         """
-        if agent_id not in self.clients:
-            self.clients[agent_id] = A2AClient(
-                base_url=f"{Config.A2A_ENDPOINT}/agents/{agent_id}",
-                api_key=Config.API_KEY
-            )
+        return _get_client(agent_id)
+    
+    @staticmethod
+    def _record_response(responses: Dict[str, Any], result: Optional[Dict[str, Any]]) -> None:
+        """
+        Add a successful agent response to the collected responses.
+        
+        Args:
+            responses: Responses collected so far, keyed by agent ID
+            result: Result of messaging an agent, or None if it timed out
+        """
+        if result is None or "response" not in result:
+            return
+        
+        responses[result["agent_id"]] = {
+            "agent_name": result["agent_name"],
+            "response": result["response"]
+        }
+    
+    async def _send_with_timeout(
+        self,
+        client: A2AClient,
+        agent: Dict[str, Any],
+        message: str,
+        timeout: Optional[float]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a message to an agent, giving up once the timeout expires.
         
-        return self.clients[agent_id]
+        Args:
+            client: A2A client
+            agent: Agent information
+            message: Message to send
+            timeout: Timeout in seconds, or None to wait indefinitely
+            
+        Returns:
+            Dictionary with the agent's response, or None if it timed out
+        """
+        try:
+            return await asyncio.wait_for(
+                self._send_message_to_agent(client, agent, message),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Communication with agent {agent['id']} timed out")
+            return None
     
     async def _send_message_to_agent(
         self,
@@ -339,24 +435,13 @@ class MultiAgentCommunicationTool(BaseTool):
             # Send the message
             response = await client.send_message(message)
             
-            # Extract response text
-            if "result" in response and "messages" in response["result"]:
-                messages = response["result"]["messages"]
-                if len(messages) > 1 and "parts" in messages[-1]:
-                    parts = messages[-1]["parts"]
-                    for part in parts:
-                        if part.get("type") == "text":
-                            return {
-                                "agent_id": agent["id"],
-                                "agent_name": agent.get("name", "Agent"),
-                                "response": part.get("text", "")
-                            }
+            # Extract response text, falling back to the raw response
+            text = _extract_text(response)
             
-            # Return the raw response
             return {
                 "agent_id": agent["id"],
                 "agent_name": agent.get("name", "Agent"),
-                "response": str(response)
+                "response": text if text is not None else str(response)
             }
         except Exception as e:
             logger.error(f"Error communicating with agent {agent['id']}: {e}")
@@ -1,14 +1,216 @@
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Union
 
 from ..config import Config
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time of a second only once and
+    reuses it for every record logged within that second.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter with an empty time cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_prefix = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the creation time of a record like logging.Formatter does.
+        
+        Args:
+            record: Record being formatted
+            datefmt: Optional date format, which bypasses the cache
+        
+        Returns:
+            Formatted time
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        
+        if self.default_msec_format:
+            return self.default_msec_format % (self._cached_prefix, record.msecs)
+        
+        return self._cached_prefix
+
+class _DispatchHandler(logging.Handler):
+    """
+    Handler run by the log listener thread, writing each record to the
+    file it was queued for and, once per record, to the console.
+    """
+    
+    def __init__(self, formatter: logging.Formatter):
+        """
+        Initialize the dispatch handler.
+        
+        Args:
+            formatter: Formatter shared by the console and file handlers
+        """
+        super().__init__()
+        self.formatter = formatter
+        self.console_handler = logging.StreamHandler(sys.stdout)
+        self.console_handler.setFormatter(formatter)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a queued record to its file and, if it is the first copy, the console.
+        
+        Args:
+            record: Record prepared by a _FileQueueHandler
+        """
+        if getattr(record, "agency_echo", True):
+            self.console_handler.handle(record)
+        
+        file_handler: logging.Handler = getattr(record, "agency_file_handler")
+        file_handler.handle(record)
+
+class _FileQueueHandler(QueueHandler):
+    """
+    Queue handler for one log file, attached to every logger writing to it.
+    
+    A record propagating through several configured loggers is queued once
+    per file, so each ancestor's file receives it, but echoed to the
+    console only once.
+    """
+    
+    def __init__(self, file_handler: logging.Handler):
+        """
+        Initialize the queue handler.
+        
+        Args:
+            file_handler: Handler writing the log file, run by the listener thread
+        """
+        super().__init__(_log_queue)
+        self.file_handler = file_handler
+        self.setLevel(file_handler.level)
+    
+    def setLevel(self, level: Union[int, str]) -> None:
+        """
+        Set the level of this handler and of its file handler.
+        
+        Args:
+            level: Logging level
+        """
+        super().setLevel(level)
+        self.file_handler.setLevel(level)
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy a record for the queue, tagged with its file and console echo.
+        
+        Args:
+            record: Record being logged
+        
+        Returns:
+            Record to enqueue
+        """
+        echo = not getattr(record, "agency_echoed", False)
+        record.agency_echoed = True
+        
+        prepared: logging.LogRecord = super().prepare(record)
+        prepared.agency_file_handler = self.file_handler
+        prepared.agency_echo = echo
+        return prepared
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Queue a record, or write it directly once the listener has stopped.
+        
+        Args:
+            record: Prepared record
+        """
+        if _listener_stopped:
+            _dispatcher.handle(record)
+        else:
+            super().enqueue(record)
+
+# Queue between the loggers and the thread that does the actual I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_dispatcher = _DispatchHandler(
+    _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_listener: Optional[QueueListener] = None
+_listener_stopped = False
+_listener_lock = threading.Lock()
+
+# One queue handler per log file, so loggers sharing a file share its descriptor
+_queue_handlers: Dict[Path, _FileQueueHandler] = {}
+
+# Names of the loggers configured by get_logger
+_logger_names: Set[str] = set()
+
+# Log directory already created by this process
+_log_dir_ready: Optional[Path] = None
+
+def _ensure_log_dir() -> Path:
+    """
+    Create the log directory if it doesn't exist, once per process.
+    
+    Returns:
+        Path to the log directory
+    """
+    global _log_dir_ready
+    log_dir = Config.LOG_DIR
+    if log_dir != _log_dir_ready:
+        with _listener_lock:
+            log_dir.mkdir(exist_ok=True)
+            _log_dir_ready = log_dir
+    
+    return log_dir
+
+def _ensure_listener() -> None:
+    """Start the background log listener if it isn't running yet."""
+    global _listener
+    with _listener_lock:
+        if _listener is None and not _listener_stopped:
+            _listener = QueueListener(_log_queue, _dispatcher)
+            _listener.start()
+
+def _stop_listener() -> None:
+    """
+    Drain the queue and stop the listener; later records are written directly.
+    """
+    global _listener, _listener_stopped
+    with _listener_lock:
+        listener = _listener
+        _listener = None
+        _listener_stopped = True
+    
+    if listener is not None:
+        listener.stop()
+    
+    handlers: List[logging.Handler] = [_dispatcher.console_handler]
+    handlers.extend(queue_handler.file_handler for queue_handler in list(_queue_handlers.values()))
+    for handler in handlers:
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            # Stream already closed, e.g. a captured stdout
+            pass
+
+# Registered before any other agency exit hook, so it runs after all of them
+atexit.register(_stop_listener)
+
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get a configured logger.
     
+    Records are handed to a queue and written to the console and the
+    logger's file by a background thread, so logging never blocks on I/O.
+    
     Args:
         name: Name for the logger
         level: Logging level (defaults to Config.LOG_LEVEL)
@@ -28,29 +230,50 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     if logger.handlers:
         return logger
     
-    # Create handlers
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
     # Create log directory if it doesn't exist
-    log_dir = Config.LOG_DIR
-    log_dir.mkdir(exist_ok=True)
+    log_dir = _ensure_log_dir()
+    
+    # Get the queue handler, shared by every logger writing to the same file
+    log_file = log_dir / f"{name.split('.')[-1]}.log"
+    with _listener_lock:
+        queue_handler = _queue_handlers.get(log_file)
+        if queue_handler is None:
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(_dispatcher.formatter)
+            file_handler.setLevel(level)
+            queue_handler = _FileQueueHandler(file_handler)
+            _queue_handlers[log_file] = queue_handler
+        elif level < queue_handler.level:
+            queue_handler.setLevel(level)
+        _logger_names.add(name)
+    
+    # Send the logger's records through the queue
+    _ensure_listener()
+    logger.addHandler(queue_handler)
+    
+    return logger
+
+def configure_logging(level: int) -> None:
+    """
+    Configure logging for the whole program; call once at program entry.
     
-    # Create file handler
-    file_handler = logging.FileHandler(log_dir / f"{name.split('.')[-1]}.log")
-    file_handler.setLevel(level)
+    Sets the level of the root logger and of every logger already created
+    by get_logger, creates the log directory and starts the log listener.
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    Args:
+        level: Logging level
+    """
+    Config.LOG_LEVEL = level
+    logging.getLogger().setLevel(level)
     
-    # Set formatter for handlers
-    console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
+    _ensure_log_dir()
+    _ensure_listener()
     
-    # Add handlers to the logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Loggers created at import time still carry the previous level
+    with _listener_lock:
+        names = list(_logger_names)
+        for queue_handler in _queue_handlers.values():
+            queue_handler.setLevel(level)
     
-    return logger
+    for name in names:
+        logging.getLogger(name).setLevel(level)
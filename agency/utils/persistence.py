@@ -1,7 +1,20 @@
+import atexit
 import json
+import mmap
+import os
 import pickle
+import shutil
+import tempfile
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, TypeVar, Generic
+from typing import Any, ContextManager, Dict, Optional, Set, Union, List, TypeVar, Generic, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from .logging import get_logger
 
@@ -9,6 +22,150 @@ logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Size in bytes above which JSON files are memory-mapped for decoding
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Directories already created by this process, so saves skip the mkdir syscalls
+_ensured_dirs: Set[Path] = set()
+
+# Auto-saving managers, flushed once at interpreter exit without keeping them alive
+_auto_save_managers: "weakref.WeakSet[PersistenceManager[Any]]" = weakref.WeakSet()
+
+def _flush_auto_save_managers() -> None:
+    """Write the pending updates of every live auto-saving manager."""
+    for manager in list(_auto_save_managers):
+        manager.flush()
+
+atexit.register(_flush_auto_save_managers)
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode data as JSON, using orjson when it is installed.
+    
+    Args:
+        data: Data to encode
+        pretty: Whether to indent the output for human readers
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # Types orjson doesn't handle (e.g. integers beyond 64 bits)
+            pass
+    
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory and its parents, once per directory per process.
+    
+    Args:
+        path: Directory to create
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """
+    Write a file so that readers see either its old or its new contents.
+    
+    The payload goes to a uniquely named temporary file next to the target,
+    takes over the target's permissions, is flushed to disk with a single
+    fsync and is then renamed over the target.
+    
+    Args:
+        path: Path to the file
+        payload: Contents to write
+    """
+    is_new = not path.exists()
+    
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            # mkstemp creates the file owner-only; keep the target's mode instead
+            if not is_new:
+                shutil.copymode(path, tmp_path)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temporary file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Persist the new directory entry the first time the file is created
+    if is_new and hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+    
+    Args:
+        raw: UTF-8 encoded JSON
+    
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    
+    return json.loads(raw)
+
+def _read_json_file(path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+    
+    Large files are memory-mapped and handed to orjson directly, so they
+    aren't copied into a bytes object first.
+    
+    Args:
+        path: Path to the file
+    
+    Returns:
+        Decoded data
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        
+        return _load_json_bytes(f.read())
+
 class PersistenceManager(Generic[T]):
     """
     Generic persistence manager for storing and retrieving data.
@@ -17,7 +174,16 @@ class PersistenceManager(Generic[T]):
     It also supports caching and automatic saving.
     """
     
-    def __init__(self, file_path: Path, default_value: T = None, auto_save: bool = True, use_cache: bool = True):
+    def __init__(
+        self,
+        file_path: Path,
+        default_value: T = None,
+        auto_save: bool = True,
+        use_cache: bool = True,
+        flush_interval: float = 0.2,
+        pretty: bool = False,
+        lock: Optional[ContextManager[Any]] = None
+    ):
         """
         Initialize the persistence manager.
         
@@ -26,12 +192,33 @@ class PersistenceManager(Generic[T]):
             default_value: Default value to return if file doesn't exist
             auto_save: Whether to automatically save data when updated
             use_cache: Whether to cache data in memory
+            flush_interval: Minimum seconds between automatic saves from
+                update(); updates in between are written once the interval
+                has passed, or earlier by save() or flush()
+            pretty: Whether to indent JSON files for human readers; they
+                are written compactly otherwise
+            lock: Reentrant lock the owner holds while changing the data, so
+                a deferred save never serializes it mid-change (defaults to
+                a private lock)
         """
         self.file_path = file_path
         self.default_value = default_value
         self.auto_save = auto_save
         self.use_cache = use_cache
+        self.flush_interval = flush_interval
+        self.pretty = pretty
         self._cache = None
+        
+        # Data from update() that hasn't been written yet, and the timer that writes it
+        self._pending: Optional[T] = None
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = lock if lock is not None else threading.RLock()
+        
+        # Make sure coalesced updates still reach the disk on shutdown
+        if auto_save:
+            _auto_save_managers.add(self)
     
     def save(self, data: T) -> bool:
         """
@@ -43,21 +230,30 @@ class PersistenceManager(Generic[T]):
         Returns:
             True if saved successfully, False otherwise
         """
-        try:
-            # Create parent directory if it doesn't exist
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # Anything pending is superseded by this data
+            self._pending = None
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
             
-            # Determine file format
-            if self.file_path.suffix.lower() == ".json":
-                return self._save_json(data)
-            elif self.file_path.suffix.lower() in [".pkl", ".pickle"]:
-                return self._save_pickle(data)
-            else:
-                # Default to JSON
-                return self._save_json(data)
-        except Exception as e:
-            logger.error(f"Failed to save data to {self.file_path}: {e}")
-            return False
+            try:
+                # Create parent directory if it doesn't exist
+                _ensure_dir(self.file_path.parent)
+                
+                # Determine file format
+                if self.file_path.suffix.lower() == ".json":
+                    return self._save_json(data)
+                elif self.file_path.suffix.lower() in [".pkl", ".pickle"]:
+                    return self._save_pickle(data)
+                else:
+                    # Default to JSON
+                    return self._save_json(data)
+            except Exception as e:
+                logger.error(f"Failed to save data to {self.file_path}: {e}")
+                return False
     
     def load(self) -> T:
         """
@@ -70,6 +266,10 @@ class PersistenceManager(Generic[T]):
         if self.use_cache and self._cache is not None:
             return self._cache
         
+        # The file is behind an update that hasn't been flushed yet
+        if self._dirty:
+            return cast(T, self._pending)
+        
         try:
             # Check if file exists
             if not self.file_path.exists():
@@ -103,89 +303,95 @@ class PersistenceManager(Generic[T]):
         Returns:
             True if updated successfully, False otherwise
         """
-        try:
-            # Load current data
-            current_data = self.load()
-            
-            # Update data
-            updated_data = updater_func(current_data)
-            
-            # Cache the updated data
-            if self.use_cache:
-                self._cache = updated_data
-            
-            # Save data if auto_save is enabled
-            if self.auto_save:
-                return self.save(updated_data)
+        with self._lock:
+            try:
+                # Load current data
+                current_data = self.load()
+                
+                # Update data
+                updated_data = updater_func(current_data)
+                
+                # Cache the updated data
+                if self.use_cache:
+                    self._cache = updated_data
+                
+                # Save data if auto_save is enabled, coalescing bursts of updates
+                if self.auto_save:
+                    elapsed = time.monotonic() - self._last_flush
+                    if elapsed >= self.flush_interval:
+                        return self.save(updated_data)
+                    
+                    self._pending = updated_data
+                    self._dirty = True
+                    
+                    # Write the last update of the burst once the interval has passed
+                    if self._flush_timer is None:
+                        self._flush_timer = threading.Timer(self.flush_interval - elapsed, self.flush)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                
+                return True
+            except Exception as e:
+                logger.error(f"Failed to update data: {e}")
+                return False
+    
+    def flush(self) -> bool:
+        """
+        Write any update that is still waiting to be saved.
+        
+        Returns:
+            True if nothing was pending or it was saved successfully, False otherwise
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
             
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update data: {e}")
-            return False
+            return self.save(cast(T, self._pending))
     
     def clear_cache(self):
         """Clear the cached data."""
         self._cache = None
     
     def _save_json(self, data: T) -> bool:
-        """Save data as JSON."""
-        try:
-            with open(self.file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save JSON to {self.file_path}: {e}")
-            return False
+        """Save data as JSON; errors are handled by save()."""
+        _atomic_write(self.file_path, _dump_json(data, self.pretty))
+        return True
     
     def _load_json(self) -> T:
-        """Load data from JSON."""
-        try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load JSON from {self.file_path}: {e}")
-            raise
+        """Load data from JSON; errors are handled by load()."""
+        return _read_json_file(self.file_path)
     
     def _save_pickle(self, data: T) -> bool:
-        """Save data as pickle."""
-        try:
-            with open(self.file_path, 'wb') as f:
-                pickle.dump(data, f)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save pickle to {self.file_path}: {e}")
-            return False
+        """Save data as pickle; errors are handled by save()."""
+        _atomic_write(self.file_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        return True
     
     def _load_pickle(self) -> T:
-        """Load data from pickle."""
-        try:
-            with open(self.file_path, 'rb') as f:
-                return pickle.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load pickle from {self.file_path}: {e}")
-            raise
+        """Load data from pickle; errors are handled by load()."""
+        with open(self.file_path, 'rb') as f:
+            return pickle.load(f)
             
 class JSONPersistence:
     """Simplified persistence class for JSON data."""
     
     @staticmethod
-    def save(file_path: Path, data: Any) -> bool:
+    def save(file_path: Path, data: Any, pretty: bool = False) -> bool:
         """
         Save data to a JSON file.
         
         Args:
             file_path: Path to the file
             data: Data to save
+            pretty: Whether to indent the file for human readers
         
         Returns:
             True if saved successfully, False otherwise
         """
         try:
             # Create parent directory if it doesn't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(file_path.parent)
             
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            _atomic_write(file_path, _dump_json(data, pretty))
             return True
         except Exception as e:
             logger.error(f"Failed to save JSON to {file_path}: {e}")
@@ -208,8 +414,7 @@ class JSONPersistence:
             if not file_path.exists():
                 return default_value
             
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            return _read_json_file(file_path)
         except Exception as e:
             logger.error(f"Failed to load JSON from {file_path}: {e}")
             return default_value
@@ -1,6 +1,10 @@
+import hashlib
+import hmac
+import os
+import secrets
 import time
 import jwt
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from starlette.requests import Request
 
 from ..config import Config
@@ -8,6 +12,68 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# scrypt cost parameters for new password hashes (about 32 MiB of memory each)
+_SCRYPT_N = 2 ** 15
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+def _scrypt_maxmem(n: int, r: int, p: int) -> int:
+    """
+    Get the memory limit scrypt needs for the given parameters.
+    
+    OpenSSL's default limit of 32 MiB is too small for n=2**15, r=8.
+    
+    Args:
+        n: CPU/memory cost
+        r: Block size
+        p: Parallelization
+    
+    Returns:
+        Memory limit in bytes, with some headroom
+    """
+    return 128 * r * (n + p + 2) + 1024 * 1024
+
+# Raw name of the header carrying the API key
+_API_KEY_HEADER = b"x-api-key"
+
+# Config values in the form the hot paths need, cached as name -> (value, derived)
+# and re-derived only when the config value changes
+_derived_config: Dict[str, Tuple[Any, Any]] = {}
+
+def _config_bytes(name: str) -> bytes:
+    """
+    Get a string config value as UTF-8 bytes, encoding it only when it changes.
+    
+    Args:
+        name: Name of the Config attribute
+    
+    Returns:
+        Encoded config value
+    """
+    value = getattr(Config, name)
+    cached = _derived_config.get(name)
+    if cached is None or cached[0] != value:
+        cached = (value, value.encode('utf-8'))
+        _derived_config[name] = cached
+    
+    encoded: bytes = cached[1]
+    return encoded
+
+def _jwt_algorithms() -> List[str]:
+    """
+    Get the list of accepted JWT algorithms, rebuilding it only when it changes.
+    
+    Returns:
+        Accepted algorithms
+    """
+    algorithm = Config.JWT_ALGORITHM
+    cached = _derived_config.get("JWT_ALGORITHM")
+    if cached is None or cached[0] != algorithm:
+        cached = (algorithm, [algorithm])
+        _derived_config["JWT_ALGORITHM"] = cached
+    
+    return cached[1]
+
 def verify_api_key(request: Request) -> bool:
     """
     Verify the API key in the request.
@@ -18,11 +84,17 @@ def verify_api_key(request: Request) -> bool:
     Returns:
         True if the API key is valid, False otherwise
     """
-    api_key = request.headers.get("x-api-key")
-    if not api_key:
-        return False
-    
-    return api_key == Config.API_KEY
+    # Scan the raw ASGI headers (names are lowercased bytes) rather than
+    # building a Headers mapping for a single lookup
+    for key, value in request.scope["headers"]:
+        if key == _API_KEY_HEADER:
+            if not value:
+                return False
+            
+            # Compare in constant time
+            return hmac.compare_digest(value, _config_bytes("API_KEY"))
+    
+    return False
 
 def generate_jwt(payload: Dict[str, Any], expiration: Optional[int] = None) -> str:
     """
@@ -44,7 +116,7 @@ def generate_jwt(payload: Dict[str, Any], expiration: Optional[int] = None) -> s
     # Generate the token
     token = jwt.encode(
         payload,
-        Config.JWT_SECRET,
+        _config_bytes("JWT_SECRET"),
         algorithm=Config.JWT_ALGORITHM
     )
     
@@ -63,8 +135,8 @@ def verify_jwt(token: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(
             token,
-            Config.JWT_SECRET,
-            algorithms=[Config.JWT_ALGORITHM]
+            _config_bytes("JWT_SECRET"),
+            algorithms=_jwt_algorithms()
         )
         return payload
     except jwt.ExpiredSignatureError:
@@ -81,8 +153,6 @@ def create_api_key() -> str:
     Returns:
         Generated API key
     """
-    import secrets
-    
     # Generate a secure random token
     token = secrets.token_hex(32)
     
@@ -92,33 +162,38 @@ def hash_password(password: str) -> str:
     """
     Hash a password for storage.
     
+    The scrypt parameters are stored with the hash, so they can be raised
+    later without invalidating existing hashes.
+    
     Args:
         password: Plain text password
     
     Returns:
-        Hashed password
+        Hashed password in the form 'scrypt$n$r$p$salt$hash'
     """
-    import hashlib
-    import os
-    
     # Generate a random salt
-    salt = os.urandom(32)
+    salt = os.urandom(16)
     
     # Hash the password with the salt
-    hash_obj = hashlib.pbkdf2_hmac(
-        'sha256',
+    hash_obj = hashlib.scrypt(
         password.encode('utf-8'),
-        salt,
-        100000
+        salt=salt,
+        n=_SCRYPT_N,
+        r=_SCRYPT_R,
+        p=_SCRYPT_P,
+        maxmem=_scrypt_maxmem(_SCRYPT_N, _SCRYPT_R, _SCRYPT_P),
+        dklen=32
     )
     
-    # Combine the salt and hash for storage
-    return salt.hex() + ':' + hash_obj.hex()
+    # Combine the parameters, salt and hash for storage
+    return f"scrypt${_SCRYPT_N}${_SCRYPT_R}${_SCRYPT_P}${salt.hex()}${hash_obj.hex()}"
 
 def verify_password(stored_password: str, provided_password: str) -> bool:
     """
     Verify a password against a stored hash.
     
+    Both scrypt hashes and legacy PBKDF2 'salt:hash' hashes are accepted.
+    
     Args:
         stored_password: Stored password hash
         provided_password: Plain text password to verify
@@ -126,22 +201,37 @@ def verify_password(stored_password: str, provided_password: str) -> bool:
     Returns:
         True if the password is correct, False otherwise
     """
-    import hashlib
-    
-    # Split the stored password into salt and hash
-    salt_hex, hash_hex = stored_password.split(':')
-    
-    # Convert the salt and hash from hex
-    salt = bytes.fromhex(salt_hex)
-    stored_hash = bytes.fromhex(hash_hex)
-    
-    # Hash the provided password with the same salt
-    hash_obj = hashlib.pbkdf2_hmac(
-        'sha256',
-        provided_password.encode('utf-8'),
-        salt,
-        100000
-    )
+    if stored_password.startswith("scrypt$"):
+        # Split the stored password into its parameters, salt and hash
+        _, n_s, r_s, p_s, salt_hex, hash_hex = stored_password.split('$')
+        n, r, p = int(n_s), int(r_s), int(p_s)
+        
+        # Hash the provided password with the same salt and parameters
+        stored_hash = bytes.fromhex(hash_hex)
+        hash_obj = hashlib.scrypt(
+            provided_password.encode('utf-8'),
+            salt=bytes.fromhex(salt_hex),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=_scrypt_maxmem(n, r, p),
+            dklen=len(stored_hash)
+        )
+    else:
+        # Split the stored password into salt and hash
+        salt_hex, hash_hex = stored_password.split(':')
+        
+        # Convert the salt and hash from hex
+        salt = bytes.fromhex(salt_hex)
+        stored_hash = bytes.fromhex(hash_hex)
+        
+        # Hash the provided password with the same salt
+        hash_obj = hashlib.pbkdf2_hmac(
+            'sha256',
+            provided_password.encode('utf-8'),
+            salt,
+            100000
+        )
     
-    # Compare the hashes
-    return hash_obj == stored_hash
+    # Compare the hashes in constant time
+    return hmac.compare_digest(hash_obj, stored_hash)
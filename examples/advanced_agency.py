@@ -10,8 +10,16 @@ for interacting with the agency.
 import os
 import asyncio
 import argparse
+import logging
+import tempfile
+import traceback
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from agency.config import Config
 from agency.agent_registry import AgentRegistry
 from agency.agent_factory import AgentFactory
@@ -19,10 +27,89 @@ from agency.parent_agent import ParentAgent
 from agency.communication.a2a_server import A2AServer
 from agency.communication.mcp_integration import MCPServerManager
 from agency.api.server import APIServer
-from agency.utils.logging import get_logger
+from agency.utils.logging import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
+# Sample agents created with --create-sample-agents, as (agent type, create_agent arguments)
+_SAMPLE_AGENT_SPECS = [
+    # Writer agent
+    ("writer", {
+        "name": "Creative Writer",
+        "description": "An agent specialized in creative writing and content creation",
+        "skills": ["creative_writing", "storytelling", "content_creation"],
+        "model": "claude-3-opus-20240229",
+        "metadata": {
+            "category": "creative",
+            "examples": [
+                ["Write a short story about a robot discovering emotions"],
+                ["Create a blog post about sustainable travel"],
+                ["Draft a product description for a new smartphone"]
+            ]
+        }
+    }),
+    # Analyst agent
+    ("analyst", {
+        "name": "Data Analyst",
+        "description": "An agent specialized in data analysis and visualization",
+        "skills": ["data_analysis", "statistics", "visualization"],
+        "model": "gemini-2.0-pro",
+        "metadata": {
+            "category": "analysis",
+            "examples": [
+                ["Analyze this CSV data and find trends"],
+                ["Calculate the correlation between these variables"],
+                ["Create a visualization of this dataset"]
+            ]
+        }
+    }),
+    # Coder agent
+    ("coder", {
+        "name": "Code Assistant",
+        "description": "An agent specialized in software development and code assistance",
+        "skills": ["programming", "code_review", "debugging"],
+        "model": "claude-3-opus-20240229",
+        "metadata": {
+            "category": "development",
+            "examples": [
+                ["Write a Python function to sort a list of dictionaries"],
+                ["Review this code for security vulnerabilities"],
+                ["Help me debug this JavaScript error"]
+            ]
+        }
+    }),
+    # Researcher agent
+    ("researcher", {
+        "name": "Research Assistant",
+        "description": "An agent specialized in research and information gathering",
+        "skills": ["research", "summarization", "fact_checking"],
+        "model": "gemini-2.0-pro",
+        "metadata": {
+            "category": "knowledge",
+            "examples": [
+                ["Research the impact of climate change on agriculture"],
+                ["Summarize the latest findings on quantum computing"],
+                ["Find credible sources about the history of artificial intelligence"]
+            ]
+        }
+    }),
+    # Assistant agent
+    ("assistant", {
+        "name": "Personal Assistant",
+        "description": "An agent specialized in task management and personal assistance",
+        "skills": ["task_management", "scheduling", "reminders"],
+        "model": "gemini-2.0-flash",
+        "metadata": {
+            "category": "productivity",
+            "examples": [
+                ["Remind me to call John tomorrow at 3 PM"],
+                ["Schedule a meeting with the team next week"],
+                ["Help me plan my vacation to Europe"]
+            ]
+        }
+    }),
+]
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Advanced AI Agency Example")
@@ -81,6 +168,8 @@ async def create_sample_agents(agent_factory):
     """
     Create sample agents for demonstration purposes.
     
+    The agents are created concurrently, each in a worker thread.
+    
     Args:
         agent_factory: Agent factory for creating agents
     
@@ -89,97 +178,15 @@ async def create_sample_agents(agent_factory):
     """
     logger.info("Creating sample agents")
     
-    agent_ids = {}
-    
-    # Writer agent
-    writer_agent = agent_factory.create_agent(
-        name="Creative Writer",
-        description="An agent specialized in creative writing and content creation",
-        skills=["creative_writing", "storytelling", "content_creation"],
-        model="claude-3-opus-20240229",
-        metadata={
-            "category": "creative",
-            "examples": [
-                ["Write a short story about a robot discovering emotions"],
-                ["Create a blog post about sustainable travel"],
-                ["Draft a product description for a new smartphone"]
-            ]
-        }
-    )
-    agent_ids["writer"] = writer_agent["id"]
-    logger.info(f"Created writer agent: {writer_agent['id']}")
-    
-    # Analyst agent
-    analyst_agent = agent_factory.create_agent(
-        name="Data Analyst",
-        description="An agent specialized in data analysis and visualization",
-        skills=["data_analysis", "statistics", "visualization"],
-        model="gemini-2.0-pro",
-        metadata={
-            "category": "analysis",
-            "examples": [
-                ["Analyze this CSV data and find trends"],
-                ["Calculate the correlation between these variables"],
-                ["Create a visualization of this dataset"]
-            ]
-        }
-    )
-    agent_ids["analyst"] = analyst_agent["id"]
-    logger.info(f"Created analyst agent: {analyst_agent['id']}")
-    
-    # Coder agent
-    coder_agent = agent_factory.create_agent(
-        name="Code Assistant",
-        description="An agent specialized in software development and code assistance",
-        skills=["programming", "code_review", "debugging"],
-        model="claude-3-opus-20240229",
-        metadata={
-            "category": "development",
-            "examples": [
-                ["Write a Python function to sort a list of dictionaries"],
-                ["Review this code for security vulnerabilities"],
-                ["Help me debug this JavaScript error"]
-            ]
-        }
-    )
-    agent_ids["coder"] = coder_agent["id"]
-    logger.info(f"Created coder agent: {coder_agent['id']}")
-    
-    # Researcher agent
-    researcher_agent = agent_factory.create_agent(
-        name="Research Assistant",
-        description="An agent specialized in research and information gathering",
-        skills=["research", "summarization", "fact_checking"],
-        model="gemini-2.0-pro",
-        metadata={
-            "category": "knowledge",
-            "examples": [
-                ["Research the impact of climate change on agriculture"],
-                ["Summarize the latest findings on quantum computing"],
-                ["Find credible sources about the history of artificial intelligence"]
-            ]
-        }
-    )
-    agent_ids["researcher"] = researcher_agent["id"]
-    logger.info(f"Created researcher agent: {researcher_agent['id']}")
+    created = await asyncio.gather(*(
+        asyncio.to_thread(agent_factory.create_agent, **spec)
+        for _, spec in _SAMPLE_AGENT_SPECS
+    ))
     
-    # Assistant agent
-    assistant_agent = agent_factory.create_agent(
-        name="Personal Assistant",
-        description="An agent specialized in task management and personal assistance",
-        skills=["task_management", "scheduling", "reminders"],
-        model="gemini-2.0-flash",
-        metadata={
-            "category": "productivity",
-            "examples": [
-                ["Remind me to call John tomorrow at 3 PM"],
-                ["Schedule a meeting with the team next week"],
-                ["Help me plan my vacation to Europe"]
-            ]
-        }
-    )
-    agent_ids["assistant"] = assistant_agent["id"]
-    logger.info(f"Created assistant agent: {assistant_agent['id']}")
+    agent_ids = {}
+    for (agent_type, _), agent in zip(_SAMPLE_AGENT_SPECS, created):
+        agent_ids[agent_type] = agent["id"]
+        logger.info(f"Created {agent_type} agent: {agent['id']}")
     
     return agent_ids
 
@@ -191,21 +198,18 @@ async def async_main(args):
         args: Command line arguments
     """
     try:
-        # Set up configuration
-        import logging
-        Config.LOG_LEVEL = getattr(logging, args.log_level)
+        # Set up configuration (the log level is set by main)
         Config.MCP_CONFIG_PATH = Path(args.mcp_config)
         
         # Use temporary directory if no registry path provided
         if args.registry_path:
             Config.REGISTRY_PATH = Path(args.registry_path)
         else:
-            import tempfile
             temp_dir = tempfile.mkdtemp()
             logger.info(f"Using temporary directory: {temp_dir}")
             Config.REGISTRY_PATH = Path(temp_dir) / "agent_registry.json"
         
-        # Load MCP configuration
+        # Load MCP configuration once; the server manager reuses it
         Config.load_mcp_config()
         
         # Initialize components
@@ -213,7 +217,7 @@ async def async_main(args):
         
         # Create MCP server manager
         logger.info("Creating MCP server manager")
-        mcp_manager = MCPServerManager(Config.MCP_CONFIG_PATH)
+        mcp_manager = MCPServerManager(Config.MCP_CONFIG_PATH, config_dict=Config.MCP_SERVERS)
         
         # Create agent registry
         logger.info("Creating agent registry")
@@ -227,45 +231,49 @@ async def async_main(args):
         logger.info("Creating parent agent")
         parent_agent = ParentAgent(registry, agent_factory, mcp_manager)
         
-        # Create A2A server
-        logger.info("Creating A2A server")
-        a2a_server = A2AServer(registry, agent_factory)
-        a2a_server.setup_routes()
-        
-        # Create sample agents if requested
-        if args.create_sample_agents:
-            agent_ids = await create_sample_agents(agent_factory)
-            logger.info(f"Created sample agents: {agent_ids}")
-        
-        # Create API server
-        logger.info("Creating API server")
-        api_server = APIServer(
-            registry=registry,
-            agent_factory=agent_factory,
-            parent_agent=parent_agent,
-            mcp_manager=mcp_manager,
-            a2a_server=a2a_server
-        )
-        
-        # Print startup information
-        logger.info(f"Advanced AI Agency System initialized")
-        logger.info(f"API server available at http://{args.host}:{args.port}")
-        logger.info(f"API endpoints:")
-        logger.info(f"  - GET    /agents - List all agents")
-        logger.info(f"  - POST   /agents - Create a new agent")
-        logger.info(f"  - GET    /agents/:id - Get agent details")
-        logger.info(f"  - PUT    /agents/:id - Update agent")
-        logger.info(f"  - DELETE /agents/:id - Delete agent")
-        logger.info(f"  - POST   /agents/:id/message - Send message to agent")
-        logger.info(f"A2A endpoints:")
-        logger.info(f"  - GET    /.well-known/agent.json - Get agency agent card")
-        logger.info(f"  - GET    /agents/:id/.well-known/agent.json - Get agent card")
-        logger.info(f"  - POST   /agents/:id - Handle agent request")
-        logger.info(f"  - POST   /agency - Handle agency request")
-        
-        # Start the server
-        logger.info(f"Starting server on {args.host}:{args.port}")
-        api_server.run(host=args.host, port=args.port)
+        try:
+            # Create A2A server
+            logger.info("Creating A2A server")
+            a2a_server = A2AServer(registry, agent_factory)
+            a2a_server.setup_routes()
+            
+            # Create sample agents if requested
+            if args.create_sample_agents:
+                agent_ids = await create_sample_agents(agent_factory)
+                logger.info(f"Created sample agents: {agent_ids}")
+            
+            # Create API server
+            logger.info("Creating API server")
+            api_server = APIServer(
+                registry=registry,
+                agent_factory=agent_factory,
+                parent_agent=parent_agent,
+                mcp_manager=mcp_manager,
+                a2a_server=a2a_server
+            )
+            
+            # Print startup information
+            logger.info(f"Advanced AI Agency System initialized")
+            logger.info(f"API server available at http://{args.host}:{args.port}")
+            logger.info(f"API endpoints:")
+            logger.info(f"  - GET    /agents - List all agents")
+            logger.info(f"  - POST   /agents - Create a new agent")
+            logger.info(f"  - GET    /agents/:id - Get agent details")
+            logger.info(f"  - PUT    /agents/:id - Update agent")
+            logger.info(f"  - DELETE /agents/:id - Delete agent")
+            logger.info(f"  - POST   /agents/:id/message - Send message to agent")
+            logger.info(f"A2A endpoints:")
+            logger.info(f"  - GET    /.well-known/agent.json - Get agency agent card")
+            logger.info(f"  - GET    /agents/:id/.well-known/agent.json - Get agent card")
+            logger.info(f"  - POST   /agents/:id - Handle agent request")
+            logger.info(f"  - POST   /agency - Handle agency request")
+            
+            # Start the server
+            logger.info(f"Starting server on {args.host}:{args.port}")
+            await api_server.serve(host=args.host, port=args.port)
+        finally:
+            # Close the parent agent's connection pool on shutdown
+            await parent_agent.aclose()
     except Exception as e:
         logger.error(f"Error in async_main: {e}")
         raise
@@ -276,11 +284,11 @@ def main():
     args = parse_args()
     
     # Set up logging
-    import logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    configure_logging(getattr(logging, args.log_level))
+    
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     # Run the asynchronous main function
     try:
@@ -289,7 +297,6 @@ def main():
         logger.info("Shutting down")
     except Exception as e:
         logger.error(f"Error in main: {e}")
-        import traceback
         traceback.print_exc()
         return 1
     
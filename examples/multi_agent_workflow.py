@@ -8,8 +8,20 @@ agents working together to complete a complex task.
 
 import os
 import asyncio
+import contextlib
+import hashlib
+import random
+import sys
+import tempfile
+import time
+import traceback
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from agency.config import Config
 from agency.agent_registry import AgentRegistry
 from agency.agent_factory import AgentFactory
@@ -19,159 +31,614 @@ from agency.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-async def main():
-    """Main function for the multi-agent workflow example."""
-    try:
-        # Use temporary directories for persistence
-        import tempfile
-        temp_dir = tempfile.mkdtemp()
-        logger.info(f"Using temporary directory: {temp_dir}")
-        
-        # Set up paths
-        registry_path = Path(temp_dir) / "agent_registry.json"
-        
-        # Create MCP server manager
-        logger.info("Creating MCP server manager")
-        mcp_manager = MCPServerManager(Config.MCP_CONFIG_PATH)
-        
-        # Create agent registry
-        logger.info("Creating agent registry")
-        registry = AgentRegistry(registry_path)
-        
-        # Create agent factory
-        logger.info("Creating agent factory")
-        agent_factory = AgentFactory(registry, mcp_manager)
-        
-        # Create parent agent
-        logger.info("Creating parent agent")
-        parent_agent = ParentAgent(registry, agent_factory, mcp_manager)
-        
-        # Create specialized agents for the workflow
-        logger.info("Creating specialized agents")
-        
-        # Researcher agent
-        researcher_agent = agent_factory.create_agent(
-            name="Research Assistant",
-            description="An agent specialized in research and information gathering",
-            skills=["research", "summarization", "fact_checking"],
-            model="gemini-2.0-pro",
-            metadata={
-                "category": "knowledge",
-                "examples": [
-                    ["Research the impact of climate change on agriculture"],
-                    ["Summarize the latest findings on quantum computing"],
-                    ["Find credible sources about the history of artificial intelligence"]
-                ]
-            }
-        )
-        logger.info(f"Created researcher agent: {researcher_agent['id']}")
-        
-        # Writer agent
-        writer_agent = agent_factory.create_agent(
-            name="Content Writer",
-            description="An agent specialized in creating high-quality written content",
-            skills=["content_creation", "storytelling", "editing"],
-            model="claude-3-opus-20240229",
-            metadata={
-                "category": "creative",
-                "examples": [
-                    ["Write a blog post about remote work trends"],
-                    ["Create an engaging product description for this smartphone"],
-                    ["Draft an email announcing our new product launch"]
-                ]
-            }
-        )
-        logger.info(f"Created writer agent: {writer_agent['id']}")
-        
-        # Editor agent
-        editor_agent = agent_factory.create_agent(
-            name="Content Editor",
-            description="An agent specialized in editing and improving written content",
-            skills=["editing", "proofreading", "feedback"],
-            model="claude-3-sonnet-20240229",
-            metadata={
-                "category": "creative",
-                "examples": [
-                    ["Edit this blog post for clarity and conciseness"],
-                    ["Proofread this document and fix any errors"],
-                    ["Provide feedback on how to improve this article"]
-                ]
-            }
-        )
-        logger.info(f"Created editor agent: {editor_agent['id']}")
-        
-        # Execute multi-agent workflow
-        logger.info("Executing multi-agent workflow")
-        
-        # Step 1: Research
-        research_topic = "The impact of artificial intelligence on healthcare"
-        logger.info(f"Researching: {research_topic}")
-        
-        research_results = await parent_agent.get_agent_response(
-            researcher_agent["id"],
-            f"Research {research_topic} and provide key findings and statistics"
-        )
-        logger.info("Research completed")
-        
-        # Step 2: Content creation
-        logger.info("Creating content based on research")
-        
-        writing_prompt = f"""
-        Write a blog post about {research_topic} based on the following research:
-        
-        {research_results}
-        
-        The blog post should be informative, engaging, and around 500 words.
+# Semaphores bounding concurrent calls per model provider, created on first use
+# so they belong to the running event loop
+_provider_semaphores = {}
+
+def _provider_semaphore(model: str) -> asyncio.Semaphore:
+    """
+    Get the semaphore shared by all calls to a model's provider.
+    
+    Providers have independent rate limits, so Gemini calls don't wait on
+    Claude calls and vice versa.
+    
+    Args:
+        model: Name of the model, e.g. 'gemini-2.0-pro'
+    
+    Returns:
+        Semaphore for the provider
+    """
+    provider = model.split("-", 1)[0]
+    semaphore = _provider_semaphores.get(provider)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(Config.LLM_CONCURRENCY)
+        _provider_semaphores[provider] = semaphore
+    
+    return semaphore
+
+# Tokens per minute each provider allows; unknown providers get the smallest budget
+_PROVIDER_TOKEN_BUDGETS = {
+    "gemini": 1_000_000,
+    "claude": 400_000,
+}
+
+# Seconds after a call before its tokens count against the budget no more
+_TOKEN_REFUND_TIME = 60.0
+
+# Tokens a response is assumed to use, on top of its prompt
+_EXPECTED_OUTPUT_TOKENS = 1024
+
+class TokenBudget:
+    """
+    Rate limiter that admits calls by estimated token cost instead of count.
+    
+    Each call spends credits for its estimated tokens and gets them back
+    refund_time seconds after it finishes, matching the tokens-per-minute
+    limits providers enforce.
+    """
+    
+    def __init__(self, capacity: int, refund_time: float):
         """
+        Initialize the token budget.
         
-        draft_content = await parent_agent.get_agent_response(
-            writer_agent["id"],
-            writing_prompt
-        )
-        logger.info("Content draft completed")
-        
-        # Step 3: Editing and refinement
-        logger.info("Editing and refining content")
-        
-        editing_prompt = f"""
-        Edit and improve the following blog post about {research_topic}:
-        
-        {draft_content}
-        
-        Focus on improving clarity, flow, and making the content more engaging.
+        Args:
+            capacity: Tokens that may be spent per refund period
+            refund_time: Seconds before spent tokens are available again
         """
+        self.capacity = capacity
+        self.refund_time = refund_time
+        self._available = capacity
+        self._condition = asyncio.Condition()
+        self._refunds = set()
+    
+    @contextlib.asynccontextmanager
+    async def spend(self, credits: int):
+        """
+        Wait until enough tokens are available and hold them for one call.
         
-        final_content = await parent_agent.get_agent_response(
-            editor_agent["id"],
-            editing_prompt
-        )
-        logger.info("Editing completed")
-        
-        # Output the final result
-        logger.info("Workflow completed. Final content:")
-        print("\n" + "="*80 + "\n")
-        print(f"# {research_topic.title()}\n")
-        print(final_content)
-        print("\n" + "="*80 + "\n")
-        
-        # Clean up
-        logger.info("Cleaning up")
+        Args:
+            credits: Estimated tokens of the call; capped at the capacity so
+                oversized calls still run, just alone
+        """
+        credits = min(credits, self.capacity)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available >= credits)
+            self._available -= credits
         
-        # Delete the agents
-        agent_factory.delete_agent(researcher_agent["id"])
-        agent_factory.delete_agent(writer_agent["id"])
-        agent_factory.delete_agent(editor_agent["id"])
+        try:
+            yield
+        finally:
+            refund = asyncio.get_running_loop().create_task(self._refund(credits))
+            self._refunds.add(refund)
+            refund.add_done_callback(self._refunds.discard)
+    
+    async def _refund(self, credits: int):
+        """
+        Make spent tokens available again once the refund time has passed.
         
-        # Remove temporary directory
-        import shutil
-        shutil.rmtree(temp_dir)
+        Args:
+            credits: Tokens to give back
+        """
+        await asyncio.sleep(self.refund_time)
+        async with self._condition:
+            self._available += credits
+            self._condition.notify_all()
+
+# Token budgets per model provider, created on first use like the semaphores
+_provider_budgets = {}
+
+def _provider_budget(model: str) -> TokenBudget:
+    """
+    Get the token budget shared by all calls to a model's provider.
+    
+    Args:
+        model: Name of the model, e.g. 'claude-3-opus-20240229'
+    
+    Returns:
+        Token budget for the provider
+    """
+    provider = model.split("-", 1)[0]
+    budget = _provider_budgets.get(provider)
+    if budget is None:
+        capacity = _PROVIDER_TOKEN_BUDGETS.get(provider, min(_PROVIDER_TOKEN_BUDGETS.values()))
+        budget = TokenBudget(capacity, _TOKEN_REFUND_TIME)
+        _provider_budgets[provider] = budget
+    
+    return budget
+
+def _estimate_tokens(prompt: str) -> int:
+    """
+    Estimate the tokens a call uses, at about four characters per token.
+    
+    Args:
+        prompt: Message to send
+    
+    Returns:
+        Estimated prompt and response tokens
+    """
+    return len(prompt) // 4 + _EXPECTED_OUTPUT_TOKENS
+
+async def budgeted_call(model: str, prompts, call):
+    """
+    Await a call once its provider's token budget can cover its prompts.
+    
+    Args:
+        model: Name of the model the call goes to
+        prompts: Prompts the call sends
+        call: Function returning the awaitable to run
+    
+    Returns:
+        Result of the call
+    """
+    async with _provider_budget(model).spend(sum(_estimate_tokens(prompt) for prompt in prompts)):
+        return await call()
+
+async def bounded_call(parent_agent, agent, prompt: str) -> str:
+    """
+    Get a response from an agent, waiting for a free slot at its provider.
+    
+    Args:
+        parent_agent: Parent agent used to talk to the agent
+        agent: Agent information
+        prompt: Message to send
+    
+    Returns:
+        Agent's response
+    """
+    async with _provider_semaphore(agent["model"]):
+        async with _provider_budget(agent["model"]).spend(_estimate_tokens(prompt)):
+            return await parent_agent.get_agent_response(agent["id"], prompt)
+
+# Time budgets in seconds for each workflow step, per attempt
+_RESEARCH_TIMEOUT = 120.0
+_WRITING_TIMEOUT = 90.0
+_EDITING_TIMEOUT = 60.0
+
+# Models of the writer and editor agents
+_WRITER_MODEL = "claude-3-opus-20240229"
+_EDITOR_MODEL = "claude-3-sonnet-20240229"
+
+def _model_family(model: str) -> str:
+    """
+    Get the family of a model, e.g. 'claude-3' for 'claude-3-opus-20240229'.
+    
+    Args:
+        model: Name of the model
+    
+    Returns:
+        Model family
+    """
+    return "-".join(model.split("-")[:2])
+
+# Metadata of the workflow agents, built once; create_agent gets a shallow copy
+_RESEARCHER_METADATA = {
+    "category": "knowledge",
+    "examples": (
+        ("Research the impact of climate change on agriculture",),
+        ("Summarize the latest findings on quantum computing",),
+        ("Find credible sources about the history of artificial intelligence",)
+    )
+}
+
+_WRITER_METADATA = {
+    "category": "creative",
+    "examples": (
+        ("Write a blog post about remote work trends",),
+        ("Create an engaging product description for this smartphone",),
+        ("Draft an email announcing our new product launch",)
+    )
+}
+
+_EDITOR_METADATA = {
+    "category": "creative",
+    "examples": (
+        ("Edit this blog post for clarity and conciseness",),
+        ("Proofread this document and fix any errors",),
+        ("Provide feedback on how to improve this article",)
+    )
+}
+
+# Whether the writer edits its own draft in the same call instead of handing it
+# to a separate editor (set FUSE_WRITE_EDIT=FALSE to compare both paths). This
+# saves a full round trip when both models come from the same family.
+_FUSE_EDITING = (
+    os.getenv("FUSE_WRITE_EDIT", "TRUE").upper() == "TRUE"
+    and _model_family(_WRITER_MODEL) == _model_family(_EDITOR_MODEL)
+)
+
+# Prompt asking the researcher about one angle of the topic; part of the cache
+# key, so editing it invalidates earlier results
+_RESEARCH_TEMPLATE = "Research the {angle} of {topic} and provide key findings and statistics"
+
+# Research results are cached across runs in AGENCY_CACHE_DIR (default
+# ~/.cache/agency), keyed by model, prompt template and prompts
+_CACHE_DIR = Path(os.getenv("AGENCY_CACHE_DIR", str(Path.home() / ".cache" / "agency")))
+
+# Seconds a cached research result stays valid (set RESEARCH_CACHE_TTL=0 to
+# always research afresh)
+_CACHE_TTL = float(os.getenv("RESEARCH_CACHE_TTL", "86400"))
+
+async def cached_call(cache_dir: Path, key: str, call, ttl: float) -> str:
+    """
+    Return a cached text result, or await a call and cache what it returns.
+    
+    Args:
+        cache_dir: Directory holding the cached results
+        key: Text identifying the result, e.g. the model and the prompt
+        call: Function returning an awaitable for the result on a cache miss
+        ttl: Seconds a cached result stays valid; 0 or less disables the cache
+    
+    Returns:
+        Cached or freshly computed result
+    """
+    if ttl <= 0:
+        return await call()
+    
+    path = cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.txt"
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        age = None
+    
+    if age is not None and age < ttl:
+        logger.info(f"Using cached result from {path}")
+        return path.read_text(encoding="utf-8")
+    
+    result = await call()
+    
+    # Write atomically so an interrupted run can't leave a truncated entry
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(result, encoding="utf-8")
+    os.replace(tmp_path, path)
+    
+    return result
+
+async def print_stream(parent_agent, agent, prompt: str) -> str:
+    """
+    Print an agent's response as it streams in.
+    
+    Args:
+        parent_agent: Parent agent used to talk to the agent
+        agent: Agent information
+        prompt: Message to send
+    
+    Returns:
+        Agent's complete response
+    """
+    chunks = []
+    async with _provider_semaphore(agent["model"]):
+        async with _provider_budget(agent["model"]).spend(_estimate_tokens(prompt)):
+            async for chunk in parent_agent.stream_agent_response(agent["id"], prompt):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+                chunks.append(chunk)
+    
+    return "".join(chunks)
+
+# Prompt templates, filled in with str.format_map; the research and drafts
+# they carry can be long, so each prompt is built in a single pass
+_WRITING_TEMPLATE = (
+    "Write a blog post about {topic} based on the following research:\n"
+    "\n"
+    "{research}\n"
+    "\n"
+    "The blog post should be informative, engaging, and around 500 words."
+)
+
+_SELF_EDITING_TEMPLATE = _WRITING_TEMPLATE + (
+    "\n"
+    "After writing it, critically edit it for clarity, flow, and engagement.\n"
+    "Output only the final edited version."
+)
+
+_PARAGRAPH_EDITING_TEMPLATE = (
+    "Edit and improve the following paragraph of a blog post about {topic}:\n"
+    "\n"
+    "{paragraph}\n"
+    "\n"
+    "Focus on improving clarity, flow, and making the content more engaging.\n"
+    "Output only the edited paragraph."
+)
+
+# Separator between paragraphs in agent responses
+_PARAGRAPH_BREAK = "\n\n"
+
+async def stream_paragraphs(parent_agent, agent, prompt: str, paragraphs: asyncio.Queue):
+    """
+    Stream an agent's response into a queue, one complete paragraph at a time.
+    
+    Args:
+        parent_agent: Parent agent used to talk to the agent
+        agent: Agent information
+        prompt: Message to send
+        paragraphs: Queue receiving the paragraphs, then None once the response ends
+    """
+    buffer = ""
+    async with _provider_semaphore(agent["model"]):
+        async with _provider_budget(agent["model"]).spend(_estimate_tokens(prompt)):
+            async for chunk in parent_agent.stream_agent_response(agent["id"], prompt):
+                buffer += chunk
+                *complete, buffer = buffer.split(_PARAGRAPH_BREAK)
+                for paragraph in complete:
+                    if paragraph.strip():
+                        await paragraphs.put(paragraph)
+    
+    if buffer.strip():
+        await paragraphs.put(buffer)
+    await paragraphs.put(None)
+
+async def edit_paragraphs(parent_agent, agent, topic: str, paragraphs: asyncio.Queue) -> str:
+    """
+    Edit paragraphs as they arrive and print the edited ones in order.
+    
+    An edit starts as soon as its paragraph is complete, so editing overlaps
+    with the rest of the draft being written.
+    
+    Args:
+        parent_agent: Parent agent used to talk to the agent
+        agent: Agent information
+        topic: Topic of the post, to give the editor some context
+        paragraphs: Queue of paragraphs to edit, ended by None
+    
+    Returns:
+        Edited post
+    """
+    edits = []
+    try:
+        while True:
+            paragraph = await paragraphs.get()
+            if paragraph is None:
+                break
+            
+            editing_prompt = _PARAGRAPH_EDITING_TEMPLATE.format_map({"topic": topic, "paragraph": paragraph})
+            edits.append(asyncio.ensure_future(bounded_call(parent_agent, agent, editing_prompt)))
         
-        logger.info("Done")
+        edited = []
+        for edit in edits:
+            text = await edit
+            print(text + _PARAGRAPH_BREAK, end="", flush=True)
+            edited.append(text)
+    except BaseException:
+        # Don't leave edits running once the post is abandoned
+        for edit in edits:
+            edit.cancel()
+        raise
+    
+    return _PARAGRAPH_BREAK.join(edited)
+
+async def write_and_edit(parent_agent, writer_agent, editor_agent, writing_prompt: str, topic: str) -> str:
+    """
+    Write a post and edit it paragraph by paragraph while it is still being written.
+    
+    Args:
+        parent_agent: Parent agent used to talk to the agents
+        writer_agent: Agent writing the draft
+        editor_agent: Agent editing the draft
+        writing_prompt: Message asking the writer for the draft
+        topic: Topic of the post
+    
+    Returns:
+        Edited post
+    """
+    paragraphs: asyncio.Queue = asyncio.Queue(maxsize=64)
+    
+    if hasattr(asyncio, "TaskGroup"):
+        # Python 3.11+: if either side fails, the other is cancelled
+        async with asyncio.TaskGroup() as group:
+            group.create_task(stream_paragraphs(parent_agent, writer_agent, writing_prompt, paragraphs))
+            editing = group.create_task(edit_paragraphs(parent_agent, editor_agent, topic, paragraphs))
+        return editing.result()
+    
+    # Older Pythons: cancel the other side ourselves, so a failed writer
+    # can't leave the editor waiting for a paragraph that never comes
+    writing = asyncio.ensure_future(stream_paragraphs(parent_agent, writer_agent, writing_prompt, paragraphs))
+    editing = asyncio.ensure_future(edit_paragraphs(parent_agent, editor_agent, topic, paragraphs))
+    try:
+        await asyncio.gather(writing, editing)
+    except BaseException:
+        writing.cancel()
+        editing.cancel()
+        raise
+    return editing.result()
+
+async def with_retry(call, timeout: float, tries: int = 3, base: float = 2.0):
+    """
+    Await a call under a timeout, retrying with jittered exponential backoff.
+    
+    Args:
+        call: Function returning a new awaitable for each attempt
+        timeout: Timeout in seconds for each attempt
+        tries: Maximum number of attempts
+        base: Base of the exponential backoff, in seconds
+    
+    Returns:
+        Result of the first attempt that succeeds
+    
+    Raises:
+        asyncio.TimeoutError: If the last attempt times out
+        ValueError: If the last attempt fails to communicate with the agent
+    """
+    for attempt in range(tries):
+        try:
+            return await asyncio.wait_for(call(), timeout=timeout)
+        except (asyncio.TimeoutError, ValueError) as e:
+            if attempt == tries - 1:
+                raise
+            
+            delay = base ** attempt + random.random()
+            logger.warning(f"Attempt {attempt + 1} failed ({e or 'timed out'}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def main():
+    """Main function for the multi-agent workflow example."""
+    try:
+        # Use a temporary directory for persistence, removed even if the example fails
+        with tempfile.TemporaryDirectory(prefix="agency_ex_") as temp_dir:
+            logger.info(f"Using temporary directory: {temp_dir}")
+            
+            # Set up paths
+            registry_path = Path(temp_dir) / "agent_registry.json"
+            
+            # Create MCP server manager
+            logger.info("Creating MCP server manager")
+            mcp_manager = MCPServerManager(Config.MCP_CONFIG_PATH)
+            
+            # Create agent registry
+            logger.info("Creating agent registry")
+            registry = AgentRegistry(registry_path)
+            
+            # Create agent factory
+            logger.info("Creating agent factory")
+            agent_factory = AgentFactory(registry, mcp_manager)
+            
+            # Create parent agent
+            logger.info("Creating parent agent")
+            parent_agent = ParentAgent(registry, agent_factory, mcp_manager)
+            
+            try:
+                # Create specialized agents for the workflow
+                logger.info("Creating specialized agents")
+                
+                # The agents don't depend on each other, so create them concurrently;
+                # the editor is only needed when the writer doesn't edit its own draft
+                creations = [
+                    # Researcher agent
+                    asyncio.to_thread(
+                        agent_factory.create_agent,
+                        name="Research Assistant",
+                        description="An agent specialized in research and information gathering",
+                        skills=["research", "summarization", "fact_checking"],
+                        model="gemini-2.0-pro",
+                        metadata=dict(_RESEARCHER_METADATA)
+                    ),
+                    # Writer agent
+                    asyncio.to_thread(
+                        agent_factory.create_agent,
+                        name="Content Writer",
+                        description="An agent specialized in creating high-quality written content",
+                        skills=["content_creation", "storytelling", "editing"],
+                        model=_WRITER_MODEL,
+                        metadata=dict(_WRITER_METADATA)
+                    )
+                ]
+                if not _FUSE_EDITING:
+                    # Editor agent
+                    creations.append(asyncio.to_thread(
+                        agent_factory.create_agent,
+                        name="Content Editor",
+                        description="An agent specialized in editing and improving written content",
+                        skills=["editing", "proofreading", "feedback"],
+                        model=_EDITOR_MODEL,
+                        metadata=dict(_EDITOR_METADATA)
+                    ))
+                
+                researcher_agent, writer_agent, *rest = await asyncio.gather(*creations)
+                editor_agent = rest[0] if rest else None
+                logger.info(f"Created researcher agent: {researcher_agent['id']}")
+                logger.info(f"Created writer agent: {writer_agent['id']}")
+                if editor_agent is not None:
+                    logger.info(f"Created editor agent: {editor_agent['id']}")
+                
+                # Execute multi-agent workflow
+                logger.info("Executing multi-agent workflow")
+                
+                # Step 1: Research
+                research_topic = "The impact of artificial intelligence on healthcare"
+                logger.info(f"Researching: {research_topic}")
+                
+                # Research each angle of the topic concurrently, then join the findings
+                research_angles = ["economic impact", "clinical outcomes", "regulation", "patient privacy"]
+                research_prompts = [
+                    _RESEARCH_TEMPLATE.format_map({"angle": angle, "topic": research_topic})
+                    for angle in research_angles
+                ]
+                
+                async def research() -> str:
+                    findings = await with_retry(
+                        lambda: budgeted_call(
+                            researcher_agent["model"],
+                            research_prompts,
+                            lambda: parent_agent.get_agent_responses(
+                                researcher_agent["id"],
+                                research_prompts,
+                                semaphore=_provider_semaphore(researcher_agent["model"])
+                            )
+                        ),
+                        timeout=_RESEARCH_TIMEOUT
+                    )
+                    return "\n\n".join(
+                        f"{angle.title()}:\n{finding}" for angle, finding in zip(research_angles, findings)
+                    )
+                
+                # Research is the slowest and costliest step, so reuse results across runs
+                research_results = await cached_call(
+                    _CACHE_DIR,
+                    "\0".join([researcher_agent["model"], _RESEARCH_TEMPLATE, *research_prompts]),
+                    research,
+                    _CACHE_TTL
+                )
+                logger.info("Research completed")
+                
+                if editor_agent is None:
+                    # Step 2: Write and self-edit in one call, streamed as it is written
+                    logger.info("Creating and editing content based on research")
+                    
+                    writing_prompt = _SELF_EDITING_TEMPLATE.format_map(
+                        {"topic": research_topic, "research": research_results}
+                    )
+                    
+                    print("\n" + "="*80 + "\n")
+                    print(f"# {research_topic.title()}\n")
+                    await asyncio.wait_for(
+                        print_stream(parent_agent, writer_agent, writing_prompt),
+                        timeout=_WRITING_TIMEOUT + _EDITING_TIMEOUT
+                    )
+                    print("\n" + "="*80 + "\n")
+                    logger.info("Workflow completed")
+                else:
+                    # Step 2: Content creation
+                    logger.info("Creating content based on research")
+                    
+                    writing_prompt = _WRITING_TEMPLATE.format_map(
+                        {"topic": research_topic, "research": research_results}
+                    )
+                    
+                    # Step 3: Editing and refinement, pipelined with the writing so
+                    # each paragraph is edited as soon as the writer finishes it
+                    logger.info("Editing and refining content as it is written")
+                    
+                    print("\n" + "="*80 + "\n")
+                    print(f"# {research_topic.title()}\n")
+                    await asyncio.wait_for(
+                        write_and_edit(parent_agent, writer_agent, editor_agent, writing_prompt, research_topic),
+                        timeout=_WRITING_TIMEOUT + _EDITING_TIMEOUT
+                    )
+                    print("="*80 + "\n")
+                    logger.info("Workflow completed")
+                
+                # Clean up
+                logger.info("Cleaning up")
+                
+                # Delete the agents concurrently
+                await asyncio.gather(*(
+                    asyncio.to_thread(agent_factory.delete_agent, agent["id"])
+                    for agent in (researcher_agent, writer_agent, editor_agent)
+                    if agent is not None
+                ))
+                
+                logger.info("Done")
+            finally:
+                # Close the parent agent's connection pool
+                await parent_agent.aclose()
     except Exception as e:
         logger.error(f"Error in main: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the asynchronous main function
     asyncio.run(main())
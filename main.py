@@ -6,8 +6,17 @@ Main entry point for the AI Agency System.
 import os
 import argparse
 import asyncio
+import logging
+import traceback
 from pathlib import Path
 
+import httpx
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from agency.config import Config
 from agency.agent_registry import AgentRegistry
 from agency.agent_factory import AgentFactory
@@ -15,6 +24,7 @@ from agency.parent_agent import ParentAgent
 from agency.communication.a2a_server import A2AServer
 from agency.communication.mcp_integration import MCPServerManager
 from agency.api.server import APIServer
+from agency.tools.communication import aclose_shared_clients
 from agency.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -80,46 +90,59 @@ async def async_main(args):
         Config.MCP_CONFIG_PATH = Path(args.mcp_config)
         Config.REGISTRY_PATH = Path(args.registry_path)
         
-        # Load MCP configuration
+        # Load MCP configuration once; the server manager reuses it
         Config.load_mcp_config()
         
-        # Initialize components
-        logger.info("Initializing AI Agency System")
-        
-        # Create MCP server manager
-        logger.info("Creating MCP server manager")
-        mcp_manager = MCPServerManager(Config.MCP_CONFIG_PATH)
-        
-        # Create agent registry
-        logger.info("Creating agent registry")
-        registry = AgentRegistry(Config.REGISTRY_PATH)
-        
-        # Create agent factory
-        logger.info("Creating agent factory")
-        agent_factory = AgentFactory(registry, mcp_manager)
-        
-        # Create parent agent
-        logger.info("Creating parent agent")
-        parent_agent = ParentAgent(registry, agent_factory, mcp_manager)
-        
-        # Create A2A server
-        logger.info("Creating A2A server")
-        a2a_server = A2AServer(registry, agent_factory)
-        a2a_server.setup_routes()
-        
-        # Create API server
-        logger.info("Creating API server")
-        api_server = APIServer(
-            registry=registry,
-            agent_factory=agent_factory,
-            parent_agent=parent_agent,
-            mcp_manager=mcp_manager,
-            a2a_server=a2a_server
-        )
-        
-        # Start the server
-        logger.info(f"Starting server on {args.host}:{args.port}")
-        api_server.run(host=args.host, port=args.port)
+        # One HTTP connection pool for the agents, closed when the server stops
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+            timeout=180.0
+        ) as http_client:
+            # Initialize components
+            logger.info("Initializing AI Agency System")
+            
+            # Create the MCP server manager and the agent registry concurrently;
+            # both block on disk and don't depend on each other. If one fails,
+            # its error is raised at once; the other runs in a worker thread,
+            # which can't be interrupted, so it just finishes in the background
+            logger.info("Creating MCP server manager and agent registry")
+            startup = [
+                asyncio.to_thread(MCPServerManager, Config.MCP_CONFIG_PATH, config_dict=Config.MCP_SERVERS),
+                asyncio.to_thread(AgentRegistry, Config.REGISTRY_PATH)
+            ]
+            mcp_manager, registry = await asyncio.gather(*startup)
+            
+            # Create agent factory
+            logger.info("Creating agent factory")
+            agent_factory = AgentFactory(registry, mcp_manager)
+            
+            # Create parent agent
+            logger.info("Creating parent agent")
+            parent_agent = ParentAgent(registry, agent_factory, mcp_manager, http_client=http_client)
+            
+            # Create A2A server
+            logger.info("Creating A2A server")
+            a2a_server = A2AServer(registry, agent_factory)
+            a2a_server.setup_routes()
+            
+            # Create API server
+            logger.info("Creating API server")
+            api_server = APIServer(
+                registry=registry,
+                agent_factory=agent_factory,
+                parent_agent=parent_agent,
+                mcp_manager=mcp_manager,
+                a2a_server=a2a_server
+            )
+            
+            # Serve on this event loop, so background tasks keep running alongside
+            logger.info(f"Starting server on {args.host}:{args.port}")
+            try:
+                await api_server.serve(host=args.host, port=args.port)
+            finally:
+                # Close the parent agent's and the communication tool's connection pools on shutdown
+                await parent_agent.aclose()
+                await aclose_shared_clients()
     except Exception as e:
         logger.error(f"Error in async_main: {e}")
         raise
@@ -130,12 +153,15 @@ def main():
     args = parse_args()
     
     # Set up logging
-    import logging
     logging.basicConfig(
         level=getattr(logging, args.log_level),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the asynchronous main function
     try:
         asyncio.run(async_main(args))
@@ -143,7 +169,6 @@ def main():
         logger.info("Shutting down")
     except Exception as e:
         logger.error(f"Error in main: {e}")
-        import traceback
         traceback.print_exc()
         return 1
     
@@ -0,0 +1,28 @@
+from agency.models.model_factory import ClaudeModelFactory
+from agency.models.model_registry import ModelRegistry
+from agency.tools import agent_creation
+from agency.tools.agent_creation import AgentCreationTool
+
+def test_available_models_are_copied(monkeypatch):
+    """Mutating the models returned by the tool leaves later answers untouched."""
+    registry = ModelRegistry()
+    registry.register_factory("claude", ClaudeModelFactory())
+    monkeypatch.setattr(agent_creation, "model_registry", registry)
+    tool = AgentCreationTool(agent_factory=None)
+    
+    models = tool.get_available_models()
+    models[0]["name"] = "changed"
+    models[0]["capabilities"].append("changed")
+    
+    model = tool.get_available_models()[0]
+    assert model["name"] != "changed"
+    assert "changed" not in model["capabilities"]
+
+def test_non_mapping_metadata_is_reported_as_error():
+    """Metadata that isn't an object yields an error response instead of raising."""
+    tool = AgentCreationTool(agent_factory=None)
+    
+    result = tool.run(name="Agent", description="Test agent", skills=["testing"], metadata="x")
+    
+    assert result["status"] == "error"
+    assert "metadata" in result["message"]
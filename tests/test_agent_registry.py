@@ -0,0 +1,26 @@
+import json
+
+from agency.agent_registry import AgentRegistry
+from agency.utils import persistence
+
+def test_burst_of_registrations_is_coalesced(tmp_path, monkeypatch):
+    """Back-to-back registrations write the registry once now and once for the rest."""
+    writes = []
+    atomic_write = persistence._atomic_write
+    
+    def counting_write(path, payload):
+        writes.append(path)
+        atomic_write(path, payload)
+    
+    monkeypatch.setattr(persistence, "_atomic_write", counting_write)
+    registry_path = tmp_path / "registry.json"
+    registry = AgentRegistry(registry_path)
+    registry.persistence.flush_interval = 60.0
+    
+    for index in range(5):
+        registry.register_agent(f"agent-{index}", {"name": f"Agent {index}"})
+    
+    assert len(writes) == 1
+    assert registry.flush()
+    assert len(writes) == 2
+    assert len(json.loads(registry_path.read_text())) == 5
@@ -0,0 +1,42 @@
+import io
+import logging
+
+from agency.config import Config
+from agency.utils import logging as agency_logging
+from agency.utils.logging import get_logger
+
+def _drain():
+    """Wait until the listener has written every queued record."""
+    agency_logging._log_queue.join()
+    for queue_handler in agency_logging._queue_handlers.values():
+        queue_handler.file_handler.flush()
+
+def test_child_logger_records_reach_parent_file(tmp_path, monkeypatch):
+    """A child logger's records are written to its own and its parent's file, and echoed once."""
+    monkeypatch.setattr(Config, "LOG_DIR", tmp_path)
+    console = io.StringIO()
+    previous_stream = agency_logging._dispatcher.console_handler.setStream(console)
+    try:
+        get_logger("propagation_parent", logging.INFO)
+        child = get_logger("propagation_parent.propagation_child", logging.INFO)
+        
+        child.info("hello from the child")
+        _drain()
+    finally:
+        agency_logging._dispatcher.console_handler.setStream(previous_stream)
+    
+    assert (tmp_path / "propagation_child.log").read_text().count("hello from the child") == 1
+    assert (tmp_path / "propagation_parent.log").read_text().count("hello from the child") == 1
+    assert console.getvalue().count("hello from the child") == 1
+
+def test_parent_records_stay_out_of_child_file(tmp_path, monkeypatch):
+    """Records of a parent logger don't leak into its children's files."""
+    monkeypatch.setattr(Config, "LOG_DIR", tmp_path)
+    parent = get_logger("isolation_parent", logging.INFO)
+    get_logger("isolation_parent.isolation_child", logging.INFO)
+    
+    parent.info("hello from the parent")
+    _drain()
+    
+    assert "hello from the parent" in (tmp_path / "isolation_parent.log").read_text()
+    assert "hello from the parent" not in (tmp_path / "isolation_child.log").read_text()
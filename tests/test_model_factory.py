@@ -0,0 +1,10 @@
+from agency.models.model_factory import ClaudeModelFactory, GPTModelFactory
+
+def test_claude_model_string_adds_provider_prefix():
+    """A bare Claude ID is routed to the Anthropic provider."""
+    assert ClaudeModelFactory().model_string("claude-3-opus") == "anthropic/claude-3-opus"
+
+def test_model_string_keeps_provider_qualified_ids():
+    """IDs that already name a provider are passed through unchanged."""
+    assert ClaudeModelFactory().model_string("anthropic/claude-3-opus") == "anthropic/claude-3-opus"
+    assert GPTModelFactory().model_string("azure/gpt-4o") == "azure/gpt-4o"
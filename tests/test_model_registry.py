@@ -0,0 +1,58 @@
+from agency.config import Config
+from agency.models.model_factory import ClaudeModelFactory
+from agency.models.model_registry import ModelRegistry
+
+def test_cached_model_listing_is_copied():
+    """Mutating a returned listing leaves the cached models untouched."""
+    registry = ModelRegistry()
+    registry.register_factory("claude", ClaudeModelFactory())
+    
+    models = registry.list_available_models()
+    models[0]["name"] = "changed"
+    models[0]["capabilities"].append("changed")
+    registry.get_model_categories()["premium"][0]["name"] = "changed"
+    
+    cached = registry.list_available_models()[0]
+    assert cached["name"] != "changed"
+    assert "changed" not in cached["capabilities"]
+    assert registry.get_model_categories()["premium"][0]["name"] != "changed"
+
+def test_lazy_factories_get_configured_arguments(monkeypatch):
+    """Factories loaded on first use receive the configured API key and Vertex AI flag."""
+    monkeypatch.setattr(Config, "MODEL_API_KEY", "test-key")
+    monkeypatch.setattr(Config, "USE_VERTEX_AI", True)
+    registry = ModelRegistry()
+    
+    claude = registry.get_factory("claude")
+    gpt = registry.get_factory("gpt")
+    
+    assert claude.api_key == "test-key"
+    assert claude.use_vertex_ai is True
+    assert gpt.api_key == "test-key"
+
+def _chain_model_type(model_id):
+    """The original if/elif chain that _determine_model_type must agree with."""
+    model_id = model_id.lower()
+    if model_id.startswith("gemini"):
+        return "gemini"
+    if model_id.startswith("claude"):
+        return "claude"
+    if any(name in model_id for name in ["gpt", "text-davinci", "openai"]):
+        return "gpt"
+    for name in ["mistral", "llama", "vertex", "palm", "bard"]:
+        if name in model_id:
+            return name
+    return None
+
+def test_model_type_matches_chain_for_overlapping_markers():
+    """Markers overlapping a lower-priority one still win, as in the original chain."""
+    model_ids = [
+        "palmistral-7b", "vertext-davinci-003", "bardgpt", "Gemini-2.0-pro",
+        "claude-3-opus", "mistral-gpt", "llama-vertex", "unknown-model",
+    ]
+    
+    for model_id in model_ids:
+        assert ModelRegistry._determine_model_type(model_id) == _chain_model_type(model_id), model_id
+    
+    assert ModelRegistry._determine_model_type("palmistral-7b") == "mistral"
+    assert ModelRegistry._determine_model_type("vertext-davinci-003") == "gpt"
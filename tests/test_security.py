@@ -0,0 +1,21 @@
+import datetime
+
+from agency.utils.security import generate_jwt, verify_jwt
+
+def test_jwt_round_trips_datetime_claims():
+    """Datetime claims are converted by PyJWT and the token still verifies."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    token = generate_jwt({"sub": "user", "iat": now})
+    
+    payload = verify_jwt(token)
+    
+    assert payload is not None
+    assert payload["sub"] == "user"
+    assert payload["iat"] == int(now.timestamp())
+    assert payload["exp"] > payload["iat"]
+
+def test_jwt_rejects_tampered_token():
+    """A token whose signature doesn't match is rejected."""
+    token = generate_jwt({"sub": "user"})
+    
+    assert verify_jwt(token[:-2] + ("AA" if not token.endswith("AA") else "BB")) is None